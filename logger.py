@@ -2,7 +2,7 @@ import os
 import logging
 from logging.handlers import RotatingFileHandler
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List, NamedTuple
 
 
 class ConsoleLogger:
@@ -42,6 +42,9 @@ class ConsoleLogger:
         self.logger.addHandler(file_handler)
         self.logger.addHandler(console_handler)
 
+    def isEnabledFor(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+
     def debug(self, message: str):
         self.logger.debug(message)
 
@@ -58,6 +61,14 @@ class ConsoleLogger:
         self.logger.critical(message)
 
 
+class LogEntry(NamedTuple):
+    ssd_sn: str
+    test_item: str
+    temperature: float
+    content: str
+    custom_filename: Optional[str] = None
+
+
 class TestResultLogger:
     def __init__(self, log_dir: str = './nvme_test_log'):
         self.log_dir = log_dir
@@ -74,10 +85,7 @@ class TestResultLogger:
     def _generate_filename(self, test_time: str, ssd_sn: str, test_item: str, temperature: float) -> str:
         return f'{test_time}-{ssd_sn}-{test_item}-{temperature}C.txt'
 
-    def log_test_result(self, ssd_sn: str, test_item: str, temperature: float, content: str, test_time: Optional[str] = None, append: bool = False, custom_filename: Optional[str] = None):
-        if test_time is None:
-            test_time = self._get_test_time()
-        
+    def _get_result_filepath(self, ssd_sn: str, test_item: str, temperature: float, test_time: str, custom_filename: Optional[str] = None) -> str:
         test_path = self._create_test_log_path(ssd_sn, test_time)
         
         if custom_filename:
@@ -85,12 +93,33 @@ class TestResultLogger:
         else:
             file_time = self._get_test_time()
             filename = self._generate_filename(file_time, ssd_sn, test_item, temperature)
-        filepath = os.path.join(test_path, filename)
+        return os.path.join(test_path, filename)
+
+    def log_test_result(self, ssd_sn: str, test_item: str, temperature: float, content: str, test_time: Optional[str] = None, append: bool = False, custom_filename: Optional[str] = None):
+        if test_time is None:
+            test_time = self._get_test_time()
+        
+        filepath = self._get_result_filepath(ssd_sn, test_item, temperature, test_time, custom_filename)
         
         mode = 'a' if append else 'w'
         with open(filepath, mode, encoding='utf-8') as f:
             f.write(content)
 
+    def batch_log(self, entries: List[LogEntry], test_time: Optional[str] = None, append: bool = False):
+        if test_time is None:
+            test_time = self._get_test_time()
+        
+        grouped = {}
+        for entry in entries:
+            filepath = self._get_result_filepath(entry.ssd_sn, entry.test_item, entry.temperature,
+                                                 test_time, entry.custom_filename)
+            grouped.setdefault(filepath, []).append(entry.content)
+        
+        mode = 'a' if append else 'w'
+        for filepath, contents in grouped.items():
+            with open(filepath, mode, encoding='utf-8') as f:
+                f.write(''.join(contents))
+
     def log_ssd_info(self, ssd_sn: str, ssd_info: dict, test_time: Optional[str] = None):
         if test_time is None:
             test_time = self._get_test_time()
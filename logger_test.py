@@ -0,0 +1,75 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from logger import TestResultLogger, LogEntry
+
+class TestTestResultLogger(unittest.TestCase):
+
+    def setUp(self):
+        """设置测试环境"""
+        self.batch_dir = tempfile.mkdtemp()
+        self.single_dir = tempfile.mkdtemp()
+        self.test_time = '20260211_121841'
+        self.entries = [
+            LogEntry('SN001', 'BIT', 25.0, 'SN001 第1段\n'),
+            LogEntry('SN002', 'BIT', 25.0, 'SN002 第1段\n'),
+            LogEntry('SN001', 'BIT', 25.0, 'SN001 第2段\n'),
+            LogEntry('SN001', 'PCT', 25.0, 'PCT 总结\n', 'pct-first-cycle.txt'),
+            LogEntry('SN002', 'CTTW', -40.0, 'CTTW 结果\n'),
+            LogEntry('SN001', 'PCT', 25.0, 'PCT 补充\n', 'pct-first-cycle.txt'),
+            LogEntry('SN001', 'BIT', 25.0, 'SN001 第3段\n')
+        ]
+
+    def tearDown(self):
+        """清理测试环境"""
+        shutil.rmtree(self.batch_dir, ignore_errors=True)
+        shutil.rmtree(self.single_dir, ignore_errors=True)
+
+    def _read_files(self, log_dir):
+        files = {}
+        for root, _, filenames in os.walk(log_dir):
+            for filename in filenames:
+                filepath = os.path.join(root, filename)
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    files[os.path.relpath(filepath, log_dir)] = f.read()
+        return files
+
+    def _write_existing(self, log_dir):
+        test_path = os.path.join(log_dir, self.test_time, 'SN001')
+        os.makedirs(test_path, exist_ok=True)
+        with open(os.path.join(test_path, 'pct-first-cycle.txt'), 'w', encoding='utf-8') as f:
+            f.write('第1轮结果\n')
+
+    @patch.object(TestResultLogger, '_get_test_time', return_value='20260211_121900')
+    def test_batch_log_matches_log_test_result(self, _):
+        """测试批量写入与逐条调用 log_test_result 的结果一致"""
+        for log_dir in (self.batch_dir, self.single_dir):
+            self._write_existing(log_dir)
+
+        TestResultLogger(self.batch_dir).batch_log(self.entries, self.test_time, append=True)
+
+        single_logger = TestResultLogger(self.single_dir)
+        for entry in self.entries:
+            single_logger.log_test_result(entry.ssd_sn, entry.test_item, entry.temperature, entry.content,
+                                          self.test_time, append=True, custom_filename=entry.custom_filename)
+
+        batch_files = self._read_files(self.batch_dir)
+        self.assertEqual(batch_files, self._read_files(self.single_dir))
+
+        sn001_path = os.path.join(self.test_time, 'SN001')
+        self.assertEqual(batch_files[os.path.join(sn001_path, '20260211_121900-SN001-BIT-25.0C.txt')],
+                         'SN001 第1段\nSN001 第2段\nSN001 第3段\n')
+        self.assertEqual(batch_files[os.path.join(sn001_path, 'pct-first-cycle.txt')],
+                         '第1轮结果\nPCT 总结\nPCT 补充\n')
+        self.assertEqual(len(batch_files), 4)
+
+    def test_batch_log_empty(self):
+        """测试空列表不写入任何文件"""
+        TestResultLogger(self.batch_dir).batch_log([], self.test_time, append=True)
+
+        self.assertEqual(self._read_files(self.batch_dir), {})
+
+if __name__ == '__main__':
+    unittest.main()
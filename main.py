@@ -5,6 +5,7 @@ import time
 import atexit
 import signal
 import sys
+import logging
 from typing import Optional, Dict, List
 from datetime import datetime
 
@@ -650,10 +651,7 @@ class NVMeTestGUI:
             bool: 更新是否成功
         """
         try:
-            # 保存当前表格数据作为备份
-            backup_data = self.window['-TEST_CONTROL_TABLE-'].get()
-            
-            # 获取当前表格数据
+            # 获取当前表格数据（下面只复制被修改的行，不会改动它，控件更新失败时用它回滚）
             current_data = self.window['-TEST_CONTROL_TABLE-'].get()
             
             # 检查索引是否有效
@@ -665,32 +663,62 @@ class NVMeTestGUI:
                 self.console_logger.error(f'列索引超出范围: {col}')
                 return False
             
-            # 修改指定单元格
-            new_data = [row.copy() for row in current_data]
+            # 修改指定单元格（只复制被修改的那一行）
+            new_data = current_data[:]
+            new_data[row] = current_data[row].copy()
             new_data[row][col] = value
             
-            # 更新表格
-            self.window['-TEST_CONTROL_TABLE-'].update(values=new_data)
-            self.window.refresh()
+            # 更新表格（优先只刷新该单元格）
+            try:
+                if not self._apply_cell_updates(new_data, ((row, col, value),)):
+                    self.window['-TEST_CONTROL_TABLE-'].update(values=new_data)
+                self.window.refresh()
+            except Exception:
+                # 控件更新失败时回滚到原始数据
+                self.window['-TEST_CONTROL_TABLE-'].update(values=current_data)
+                self.window.refresh()
+                self.console_logger.info('表格数据已回滚到原始状态')
+                raise
             
-            # 比较更新前后的数据
-            diff = self._compare_table_data(current_data, new_data)
-            if diff:
-                self.console_logger.info(f'表格单元格更新成功: 行={row}, 列={col}, 新值={value}')
-                self.console_logger.debug(f'更新差异: {diff}')
+            # 比较更新前后的数据（差异只用于日志输出，日志级别不输出时跳过）
+            if self.console_logger.isEnabledFor(logging.INFO):
+                diff = self._compare_table_data(current_data, new_data)
+                if diff:
+                    self.console_logger.info(f'表格单元格更新成功: 行={row}, 列={col}, 新值={value}')
+                    self.console_logger.debug(f'更新差异: {diff}')
             
             return True
             
         except Exception as e:
-            # 发生异常时回滚到备份状态
-            if 'backup_data' in locals():
-                self.window['-TEST_CONTROL_TABLE-'].update(values=backup_data)
-                self.window.refresh()
-                self.console_logger.info('表格数据已回滚到原始状态')
-            
             self.console_logger.error(f'更新表格单元格失败: {e}')
             return False
     
+    def _apply_cell_updates(self, new_data: list, cells) -> bool:
+        """
+        直接修改表格控件中的指定单元格，避免整表重建
+        
+        Args:
+            new_data: 更新后的完整表格数据
+            cells: 需要刷新的单元格，每个元素为 (row, col, value)
+            
+        Returns:
+            bool: 是否已完成局部更新，返回 False 时需要调用 update(values=...) 整表更新
+        """
+        table = self.window['-TEST_CONTROL_TABLE-']
+        tree = getattr(table, 'TKTreeview', None)
+        tree_ids = getattr(table, 'tree_ids', None)
+        if tree is None or not isinstance(tree_ids, list) or len(tree_ids) != len(new_data):
+            return False
+        
+        # 显示行号时控件第一列为行号列
+        col_offset = 1 if getattr(table, 'DisplayRowNumbers', False) else 0
+        for row, col, value in cells:
+            tree.set(tree_ids[row], col + col_offset, value)
+        
+        # 同步控件保存的数据，保证之后 get() 取到的是新数据
+        table.Values = new_data
+        return True
+    
     def _compare_table_data(self, old_data: list, new_data: list) -> list:
         """
         比较更新前后的表格数据差异
@@ -704,12 +732,14 @@ class NVMeTestGUI:
         """
         diff = []
         
-        # 遍历所有行
-        for i in range(min(len(old_data), len(new_data))):
+        # 遍历所有行，未修改的行与原数据共享同一对象，直接跳过
+        for i, (old_row, new_row) in enumerate(zip(old_data, new_data)):
+            if old_row is new_row or old_row == new_row:
+                continue
             # 遍历所有列
-            for j in range(min(len(old_data[i]), len(new_data[i]))):
-                if old_data[i][j] != new_data[i][j]:
-                    diff.append((i, j, old_data[i][j], new_data[i][j]))
+            for j, (old_value, new_value) in enumerate(zip(old_row, new_row)):
+                if old_value != new_value:
+                    diff.append((i, j, old_value, new_value))
         
         # 处理行数不同的情况
         if len(old_data) != len(new_data):
@@ -734,10 +764,7 @@ class NVMeTestGUI:
             bool: 更新是否成功
         """
         try:
-            # 保存当前表格数据作为备份
-            backup_data = self.window['-TEST_CONTROL_TABLE-'].get()
-            
-            # 获取当前表格数据
+            # 获取当前表格数据（下面只复制被修改的行，不会改动它，控件更新失败时用它回滚）
             current_data = self.window['-TEST_CONTROL_TABLE-'].get()
             
             # 检查行索引是否有效
@@ -751,28 +778,30 @@ class NVMeTestGUI:
                 return False
             
             # 替换指定行
-            new_data = [row.copy() for row in current_data]
+            new_data = current_data[:]
             new_data[row] = new_row_data.copy()
             
             # 更新表格
-            self.window['-TEST_CONTROL_TABLE-'].update(values=new_data)
-            self.window.refresh()
+            try:
+                self.window['-TEST_CONTROL_TABLE-'].update(values=new_data)
+                self.window.refresh()
+            except Exception:
+                # 控件更新失败时回滚到原始数据
+                self.window['-TEST_CONTROL_TABLE-'].update(values=current_data)
+                self.window.refresh()
+                self.console_logger.info('表格数据已回滚到原始状态')
+                raise
             
-            # 比较更新前后的数据
-            diff = self._compare_table_data(current_data, new_data)
-            if diff:
-                self.console_logger.info(f'表格行更新成功: 行={row}')
-                self.console_logger.debug(f'更新差异: {diff}')
+            # 比较更新前后的数据（差异只用于日志输出，日志级别不输出时跳过）
+            if self.console_logger.isEnabledFor(logging.INFO):
+                diff = self._compare_table_data(current_data, new_data)
+                if diff:
+                    self.console_logger.info(f'表格行更新成功: 行={row}')
+                    self.console_logger.debug(f'更新差异: {diff}')
             
             return True
             
         except Exception as e:
-            # 发生异常时回滚到备份状态
-            if 'backup_data' in locals():
-                self.window['-TEST_CONTROL_TABLE-'].update(values=backup_data)
-                self.window.refresh()
-                self.console_logger.info('表格数据已回滚到原始状态')
-            
             self.console_logger.error(f'更新表格行失败: {e}')
             return False
     
@@ -787,10 +816,7 @@ class NVMeTestGUI:
             bool: 更新是否成功
         """
         try:
-            # 保存当前表格数据作为备份
-            backup_data = self.window['-TEST_CONTROL_TABLE-'].get()
-            
-            # 获取当前表格数据
+            # 获取当前表格数据（下面只复制被修改的行，不会改动它，控件更新失败时用它回滚）
             current_data = self.window['-TEST_CONTROL_TABLE-'].get()
             
             # 检查更新数据是否为空
@@ -798,40 +824,51 @@ class NVMeTestGUI:
                 self.console_logger.warning('更新数据为空')
                 return True
             
-            # 检查所有索引是否有效
+            # 检查索引并按行分组待修改的单元格（索引无效时原数据不受影响）
+            row_count = len(current_data)
+            cells_by_row = {}
             for (row, col), value in update_data.items():
-                if row < 0 or row >= len(current_data):
+                if not 0 <= row < row_count:
                     self.console_logger.error(f'行索引超出范围: {row}')
                     return False
                 
-                if col < 0 or col >= len(current_data[0]):
+                if not 0 <= col < len(current_data[row]):
                     self.console_logger.error(f'列索引超出范围: {col}')
                     return False
+                
+                cells_by_row.setdefault(row, []).append((col, value))
+            
+            # 按行写入，每个涉及到的行只复制一次
+            new_data = current_data[:]
+            for row, cells in cells_by_row.items():
+                row_data = current_data[row].copy()
+                for col, value in cells:
+                    row_data[col] = value
+                new_data[row] = row_data
+            
+            # 更新表格（修改的单元格不超过一半时只刷新这些单元格，否则整表更新）
+            cells = ((row, col, value) for (row, col), value in update_data.items())
+            try:
+                if len(update_data) * 2 > sum(map(len, current_data)) or not self._apply_cell_updates(new_data, cells):
+                    self.window['-TEST_CONTROL_TABLE-'].update(values=new_data)
+                self.window.refresh()
+            except Exception:
+                # 控件更新失败时回滚到原始数据
+                self.window['-TEST_CONTROL_TABLE-'].update(values=current_data)
+                self.window.refresh()
+                self.console_logger.info('表格数据已回滚到原始状态')
+                raise
             
-            # 批量修改指定单元格
-            new_data = [row.copy() for row in current_data]
-            for (row, col), value in update_data.items():
-                new_data[row][col] = value
-            
-            # 更新表格
-            self.window['-TEST_CONTROL_TABLE-'].update(values=new_data)
-            self.window.refresh()
-            
-            # 比较更新前后的数据
-            diff = self._compare_table_data(current_data, new_data)
-            if diff:
-                self.console_logger.info(f'表格数据批量更新成功，共更新 {len(update_data)} 个单元格')
-                self.console_logger.debug(f'更新差异: {diff}')
+            # 比较更新前后的数据（差异只用于日志输出，日志级别不输出时跳过）
+            if self.console_logger.isEnabledFor(logging.INFO):
+                diff = self._compare_table_data(current_data, new_data)
+                if diff:
+                    self.console_logger.info(f'表格数据批量更新成功，共更新 {len(update_data)} 个单元格')
+                    self.console_logger.debug(f'更新差异: {diff}')
             
             return True
             
         except Exception as e:
-            # 发生异常时回滚到备份状态
-            if 'backup_data' in locals():
-                self.window['-TEST_CONTROL_TABLE-'].update(values=backup_data)
-                self.window.refresh()
-                self.console_logger.info('表格数据已回滚到原始状态')
-            
             self.console_logger.error(f'批量更新表格数据失败: {e}')
             return False
     
@@ -1760,6 +1797,8 @@ class NVMeTestGUI:
                 self._open_report_dir()
         
         self.window.close()
+        if self.host_manager:
+            self.host_manager.close()
         self.console_logger.info('NVMe SSD测试系统关闭')
 
 
@@ -7,7 +7,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from chamber_controller import ChamberController
 from test_host_manager import TestHostManager
 from test_script_parser import TestCommand
-from logger import ConsoleLogger, TestResultLogger
+from logger import ConsoleLogger, TestResultLogger, LogEntry
 from test_summary_generator import TestSummaryGenerator
 
 
@@ -119,6 +119,22 @@ class TestExecutor:
         
         return selected_hosts_list
 
+    def _run_on_hosts(self, hosts: List, func: Callable, *args):
+        if not hosts:
+            self.console_logger.warning('没有可执行测试的主板')
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+            futures = {executor.submit(func, host, *args): host for host in hosts}
+            
+            for future in as_completed(futures):
+                host = futures[future]
+                try:
+                    future.result()
+                    self.console_logger.info(f'{host.name} 测试完成')
+                except Exception as e:
+                    self.console_logger.error(f'{host.name} 测试异常: {e}')
+
     def _notify_progress(self):
         for callback in self.progress_callbacks:
             callback(self.progress)
@@ -178,8 +194,7 @@ class TestExecutor:
         def monitor():
             while not self.stop_temperature_monitor:
                 selected_hosts = self._get_selected_hosts()
-                selected_host_names = [host.name for host in selected_hosts]
-                all_temps = self.host_manager.get_all_ssd_temperatures(selected_hosts=selected_host_names)
+                all_temps = self.host_manager.get_all_ssd_temperatures(selected_hosts=selected_hosts)
                 timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 
                 for host_name, temps in all_temps.items():
@@ -282,10 +297,9 @@ class TestExecutor:
         ssd_list = host.get_ssd_list()
         
         def run_ssd_test(ssd_path):
-            ssd_info = host.get_ssd_info(ssd_path)
+            ssd_info, link_status, smart_info = host.get_ssd_snapshot(ssd_path)
             ssd_sn = ssd_info.get('SN', 'unknown')
             
-            link_status = host.get_ssd_link_status(ssd_path)
             # 确保link_status是一个字典
             if isinstance(link_status, dict):
                 link_info = link_status.get('link', '')
@@ -299,8 +313,6 @@ class TestExecutor:
                 self.console_logger.error(f'获取SSD链路状态失败: {ssd_sn}, 链路状态类型: {type(link_status).__name__}')
                 link_info = 'N/A'
             
-            smart_info = host.get_ssd_smart(ssd_path)
-            
             result_content = f'{test_item}测试结果 - 第{cycle}轮\n'
             result_content += f'测试开始时间: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n'
             result_content += f'SSD路径: {ssd_path}\n'
@@ -411,10 +423,9 @@ class TestExecutor:
         ssd_list = host.get_ssd_list()
         
         def run_ssd_test(ssd_path):
-            ssd_info = host.get_ssd_info(ssd_path)
+            ssd_info, link_status, smart_info = host.get_ssd_snapshot(ssd_path)
             ssd_sn = ssd_info.get('SN', 'unknown')
             
-            link_status = host.get_ssd_link_status(ssd_path)
             # 确保link_status是一个字典
             if isinstance(link_status, dict):
                 link_info = link_status.get('link', '')
@@ -428,8 +439,6 @@ class TestExecutor:
                 self.console_logger.error(f'获取SSD链路状态失败: {ssd_sn}, 链路状态类型: {type(link_status).__name__}')
                 link_info = 'N/A'
             
-            smart_info = host.get_ssd_smart(ssd_path)
-            
             fio_command = (f'fio --ioengine=libaio --bs=1M --iodepth=128 --numjobs=1 '
                            f'--direct=1 --name=test --rw=write --filename=$i --verify=crc32c '
                            f'--do_verify=1 --group_reporting --size={capacity_percent}%')
@@ -490,10 +499,9 @@ class TestExecutor:
         ssd_list = host.get_ssd_list()
         
         def run_ssd_test(ssd_path):
-            ssd_info = host.get_ssd_info(ssd_path)
+            ssd_info, link_status, smart_info = host.get_ssd_snapshot(ssd_path)
             ssd_sn = ssd_info.get('SN', 'unknown')
             
-            link_status = host.get_ssd_link_status(ssd_path)
             # 确保link_status是一个字典
             if isinstance(link_status, dict):
                 link_info = link_status.get('link', '')
@@ -507,8 +515,6 @@ class TestExecutor:
                 self.console_logger.error(f'获取SSD链路状态失败: {ssd_sn}, 链路状态类型: {type(link_status).__name__}')
                 link_info = 'N/A'
             
-            smart_info = host.get_ssd_smart(ssd_path)
-            
             fio_command = (f'fio --ioengine=libaio --bs=1M --iodepth=128 --numjobs=1 '
                            f'--direct=1 --name=test --rw=write --filename=$i --verify=crc32c '
                            f'--do_verify=0 --group_reporting --size={capacity_percent}%')
@@ -570,10 +576,9 @@ class TestExecutor:
         ssd_list = host.get_ssd_list()
         
         def run_ssd_test(ssd_path):
-            ssd_info = host.get_ssd_info(ssd_path)
+            ssd_info, link_status, smart_info = host.get_ssd_snapshot(ssd_path)
             ssd_sn = ssd_info.get('SN', 'unknown')
             
-            link_status = host.get_ssd_link_status(ssd_path)
             link_info = link_status.get('link', '')
             if 'Speed 8GT/s' not in link_info or 'Width x4' not in link_info:
                 self.console_logger.warning(f'SSD链路不是Gen3x4 (Speed 8GT/s, Width x4): {ssd_sn}')
@@ -582,8 +587,6 @@ class TestExecutor:
                                                self.test_time, test_item='CTTR', 
                                                temperature=self.progress.current_temperature)
             
-            smart_info = host.get_ssd_smart(ssd_path)
-            
             fio_command = (f'fio --ioengine=libaio --bs=1M --iodepth=128 --numjobs=1 '
                            f'--direct=0 --name=test --rw=read --filename=$i --verify=crc32c '
                            f'--do_verify=1 --group_reporting --size={capacity_percent}%')
@@ -675,6 +678,7 @@ class TestExecutor:
             self._notify_progress()
             
             cycle_start_time = datetime.now()
+            cycle_t0 = time.monotonic()
             self.console_logger.info(f'PCT测试第{cycle}/{cycles}轮')
             self.console_logger.info(f'本轮测试开始时间: {cycle_start_time.strftime("%Y-%m-%d %H:%M:%S")}')
             self._notify_log(f'PCT测试进度: {cycle}/{cycles}')
@@ -682,17 +686,16 @@ class TestExecutor:
             self.host_manager.wake_selected_hosts(selected_hosts)
             time.sleep(wait_time_after_wol)
             
-            selected_host_names = [host.name for host in selected_hosts]
-            if not self.host_manager.wait_all_hosts_online(selected_hosts=selected_host_names):
+            if not self.host_manager.wait_all_hosts_online(selected_hosts=selected_hosts):
                 self.console_logger.error('等待主机上线超时')
                 return False
             
-            if not self.host_manager.connect_all_hosts(selected_hosts=selected_host_names):
+            if not self.host_manager.connect_all_hosts(selected_hosts=selected_hosts):
                 self.console_logger.error('连接主机失败')
                 return False
             
             print(f"[DEBUG] 调用 get_all_ssd_info, 选中的主机: {selected_host_names}")
-            current_ssd_info = self.host_manager.get_all_ssd_info(selected_hosts=selected_host_names)
+            current_ssd_info = self.host_manager.get_all_ssd_info(selected_hosts=selected_hosts)
             
             print(f"[DEBUG] get_all_ssd_info 返回值类型: {type(current_ssd_info).__name__}, 长度: {len(current_ssd_info) if hasattr(current_ssd_info, '__len__') else 'N/A'}")
             
@@ -703,60 +706,52 @@ class TestExecutor:
             print(f"[DEBUG] 调用 _check_ssd_consistency")
             if not self._check_ssd_consistency(current_ssd_info, test_item='PCT'):
                 self.console_logger.error('SSD信息一致性检查失败')
-                self.host_manager.disconnect_all_hosts(selected_hosts=selected_host_names)
+                self.host_manager.disconnect_all_hosts(selected_hosts=selected_hosts)
                 return False
             
             if cycle == 1:
+                file_time = datetime.now().strftime('%Y%m%d_%H%M%S')
                 for ssd_sn, ssd_info in current_ssd_info.items():
                     if isinstance(ssd_info, dict):
-                        file_time = datetime.now().strftime('%Y%m%d_%H%M%S')
                         filename = f'{file_time}-{ssd_sn}-PCT-{self.progress.current_temperature}C.txt'
                         self.pct_first_cycle_filename[ssd_sn] = filename
                     else:
                         print(f"[DEBUG] 跳过非字典类型的SSD信息: {ssd_sn}, 类型: {type(ssd_info).__name__}")
             
-            with ThreadPoolExecutor(max_workers=len(selected_hosts)) as executor:
-                futures = {executor.submit(self._run_host_test, host, cycle, fio_size, 'PCT', self.pct_first_cycle_filename): host for host in selected_hosts}
-                
-                for future in as_completed(futures):
-                    host = futures[future]
-                    try:
-                        results = future.result()
-                        self.console_logger.info(f'{host.name} 测试完成')
-                    except Exception as e:
-                        self.console_logger.error(f'{host.name} 测试异常: {e}')
+            self._run_on_hosts(selected_hosts, self._run_host_test, cycle, fio_size, 'PCT', self.pct_first_cycle_filename)
             
-            selected_host_names = [host.name for host in selected_hosts]
-            self.host_manager.shutdown_all_hosts(selected_hosts=selected_host_names)
+            self.host_manager.shutdown_all_hosts(selected_hosts=selected_hosts)
             self.console_logger.info(f'已发送关机命令到: {", ".join(selected_host_names)}')
             time.sleep(wait_time_after_shutdown)
             
-            if not self.host_manager.wait_all_hosts_shutdown(selected_hosts=selected_host_names):
+            if not self.host_manager.wait_all_hosts_shutdown(selected_hosts=selected_hosts):
                 self.console_logger.warning('等待主机关机超时')
             
-            self.host_manager.disconnect_all_hosts(selected_hosts=selected_host_names)
+            self.host_manager.disconnect_all_hosts(selected_hosts=selected_hosts)
             
-            cycle_end_time = datetime.now()
-            cycle_duration = (cycle_end_time - cycle_start_time).total_seconds()
-            self.console_logger.info(f'本轮测试结束时间: {cycle_end_time.strftime("%Y-%m-%d %H:%M:%S")}')
+            cycle_duration = time.monotonic() - cycle_t0
+            cycle_end_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.console_logger.info(f'本轮测试结束时间: {cycle_end_str}')
             self.console_logger.info(f'本轮测试耗时: {cycle_duration:.2f}秒')
             
-            cycle_ssd_info = self.host_manager.get_all_ssd_info(selected_hosts=selected_host_names)
+            cycle_ssd_info = self.host_manager.get_all_ssd_info(selected_hosts=selected_hosts)
             print(f"[DEBUG] cycle_ssd_info 类型: {type(cycle_ssd_info).__name__}, 长度: {len(cycle_ssd_info) if hasattr(cycle_ssd_info, '__len__') else 'N/A'}")
+            summary_entries = []
             for ssd_sn, ssd_info in cycle_ssd_info.items():
                 if isinstance(ssd_info, dict):
                     summary_content = f'\n{"="*60}\n'
                     summary_content += f'第{cycle}轮测试总结\n'
-                    summary_content += f'测试结束时间: {cycle_end_time.strftime("%Y-%m-%d %H:%M:%S")}\n'
+                    summary_content += f'测试结束时间: {cycle_end_str}\n'
                     summary_content += f'本轮测试耗时: {cycle_duration:.2f}秒\n'
                     summary_content += f'{"="*60}\n'
                     
-                    filename = self.pct_first_cycle_filename.get(ssd_sn) if ssd_sn in self.pct_first_cycle_filename else None
-                    self.result_logger.log_test_result(ssd_sn, 'PCT', 
-                                                           self.progress.current_temperature, 
-                                                           summary_content, self.test_time, append=True, filename=filename)
+                    filename = self.pct_first_cycle_filename.get(ssd_sn)
+                    summary_entries.append(LogEntry(ssd_sn, 'PCT', self.progress.current_temperature,
+                                                    summary_content, filename))
                 else:
                     print(f"[DEBUG] 跳过非字典类型的SSD信息: {ssd_sn}, 类型: {type(ssd_info).__name__}")
+            
+            self.result_logger.batch_log(summary_entries, self.test_time, append=True)
         
         self.console_logger.info(f'PCT测试完成: {cycles}轮')
         self._notify_log(f'PCT测试完成: {cycles}轮')
@@ -783,32 +778,31 @@ class TestExecutor:
         self._notify_progress()
         
         test_start_time = datetime.now()
+        test_t0 = time.monotonic()
         self.console_logger.info(f'测试开始时间: {test_start_time.strftime("%Y-%m-%d %H:%M:%S")}')
         
-        selected_hosts = self._get_selected_hosts()
         self.host_manager.wake_selected_hosts(selected_hosts)
         time.sleep(40)
         
-        selected_host_names = [host.name for host in selected_hosts]
-        if not self.host_manager.wait_all_hosts_online(selected_hosts=selected_host_names):
+        if not self.host_manager.wait_all_hosts_online(selected_hosts=selected_hosts):
             self.console_logger.error('等待主机上线超时')
             return False
         
-        if not self.host_manager.connect_all_hosts(selected_hosts=selected_host_names):
+        if not self.host_manager.connect_all_hosts(selected_hosts=selected_hosts):
             self.console_logger.error('连接主机失败')
             return False
         
-        current_ssd_info = self.host_manager.get_all_ssd_info(selected_hosts=selected_host_names)
+        current_ssd_info = self.host_manager.get_all_ssd_info(selected_hosts=selected_hosts)
         
         if not self._check_ssd_consistency(current_ssd_info, test_item='BIT'):
             self.console_logger.error('SSD信息一致性检查失败')
-            self.host_manager.disconnect_all_hosts(selected_hosts=selected_host_names)
+            self.host_manager.disconnect_all_hosts(selected_hosts=selected_hosts)
             return False
         
-        start_temps = self.host_manager.get_all_ssd_temperatures(selected_hosts=selected_host_names)
+        start_temps = self.host_manager.get_all_ssd_temperatures(selected_hosts=selected_hosts)
         self._start_temperature_monitor(temp_check_interval)
         
-        bit_ssd_info = self.host_manager.get_all_ssd_info(selected_hosts=selected_host_names)
+        bit_ssd_info = self.host_manager.get_all_ssd_info(selected_hosts=selected_hosts)
         
         # 添加调试代码，查看 bit_ssd_info 的类型和值
         self.console_logger.info(f'[DEBUG] bit_ssd_info 类型: {type(bit_ssd_info).__name__}')
@@ -817,37 +811,28 @@ class TestExecutor:
         else:
             self.console_logger.error(f'[DEBUG] bit_ssd_info 不是字典类型: {bit_ssd_info}')
         
-        with ThreadPoolExecutor(max_workers=len(selected_hosts)) as executor:
-            futures = {executor.submit(self._run_host_test_bit, host, capacity_percent): host for host in selected_hosts}
-            
-            for future in as_completed(futures):
-                host = futures[future]
-                try:
-                    results = future.result()
-                    self.console_logger.info(f'{host.name} 测试完成')
-                except Exception as e:
-                    self.console_logger.error(f'{host.name} 测试异常: {e}')
+        self._run_on_hosts(selected_hosts, self._run_host_test_bit, capacity_percent)
         
         self._stop_temperature_monitor()
-        end_temps = self.host_manager.get_all_ssd_temperatures(selected_hosts=selected_host_names)
+        end_temps = self.host_manager.get_all_ssd_temperatures(selected_hosts=selected_hosts)
         test_end_time = datetime.now()
         self._save_temperature_summary(start_temps, end_temps, test_start_time, test_end_time)
         
-        selected_host_names = [host.name for host in selected_hosts]
-        self.host_manager.shutdown_all_hosts(selected_hosts=selected_host_names)
+        self.host_manager.shutdown_all_hosts(selected_hosts=selected_hosts)
         time.sleep(15)
         
-        if not self.host_manager.wait_all_hosts_shutdown(selected_hosts=selected_host_names):
+        if not self.host_manager.wait_all_hosts_shutdown(selected_hosts=selected_hosts):
             self.console_logger.warning('等待主机关机超时')
         
-        self.host_manager.disconnect_all_hosts(selected_hosts=selected_host_names)
+        self.host_manager.disconnect_all_hosts(selected_hosts=selected_hosts)
         
-        test_duration = (test_end_time - test_start_time).total_seconds()
+        test_duration = time.monotonic() - test_t0
         self.console_logger.info(f'测试结束时间: {test_end_time.strftime("%Y-%m-%d %H:%M:%S")}')
         self.console_logger.info(f'测试总耗时: {test_duration:.2f}秒')
         
         # 添加调试代码，查看 bit_ssd_info 的类型和值
         self.console_logger.info(f'[DEBUG] 开始处理测试结果，bit_ssd_info 类型: {type(bit_ssd_info).__name__}')
+        summary_entries = []
         if isinstance(bit_ssd_info, dict):
             # 检查 bit_ssd_info 的结构
             first_key = next(iter(bit_ssd_info.keys()), None)
@@ -869,9 +854,7 @@ class TestExecutor:
                                 additional_info=ssd_info
                             )
                             
-                            self.result_logger.log_test_result(ssd_sn, 'BIT', 
-                                                               self.progress.current_temperature, 
-                                                               summary_content, self.test_time, append=True)
+                            summary_entries.append(LogEntry(ssd_sn, 'BIT', self.progress.current_temperature, summary_content))
                         else:
                             self.console_logger.error(f'[DEBUG] ssd_info 不是字典类型: {ssd_info}')
                 else:
@@ -894,9 +877,7 @@ class TestExecutor:
                                         additional_info=ssd_info
                                     )
                                     
-                                    self.result_logger.log_test_result(ssd_sn, 'BIT', 
-                                                                       self.progress.current_temperature, 
-                                                                       summary_content, self.test_time, append=True)
+                                    summary_entries.append(LogEntry(ssd_sn, 'BIT', self.progress.current_temperature, summary_content))
                                 else:
                                     self.console_logger.error(f'[DEBUG] ssd_info 不是字典类型: {ssd_info}')
                         else:
@@ -906,6 +887,8 @@ class TestExecutor:
         else:
             self.console_logger.error(f'[DEBUG] bit_ssd_info 不是字典类型: {bit_ssd_info}')
         
+        self.result_logger.batch_log(summary_entries, self.test_time, append=True)
+        
         self.console_logger.info('BIT测试完成')
         self._notify_log('BIT测试完成')
         return True
@@ -931,62 +914,52 @@ class TestExecutor:
         self._notify_progress()
         
         test_start_time = datetime.now()
+        test_t0 = time.monotonic()
         self.console_logger.info(f'测试开始时间: {test_start_time.strftime("%Y-%m-%d %H:%M:%S")}')
         
-        selected_hosts = self._get_selected_hosts()
         self.host_manager.wake_selected_hosts(selected_hosts)
         time.sleep(40)
         
-        selected_host_names = [host.name for host in selected_hosts]
-        if not self.host_manager.wait_all_hosts_online(selected_hosts=selected_host_names):
+        if not self.host_manager.wait_all_hosts_online(selected_hosts=selected_hosts):
             self.console_logger.error('等待主机上线超时')
             return False
         
-        if not self.host_manager.connect_all_hosts(selected_hosts=selected_host_names):
+        if not self.host_manager.connect_all_hosts(selected_hosts=selected_hosts):
             self.console_logger.error('连接主机失败')
             return False
         
-        current_ssd_info = self.host_manager.get_all_ssd_info(selected_hosts=selected_host_names)
+        current_ssd_info = self.host_manager.get_all_ssd_info(selected_hosts=selected_hosts)
         
         if not self._check_ssd_consistency(current_ssd_info, test_item='CTTW'):
             self.console_logger.error('SSD信息一致性检查失败')
-            self.host_manager.disconnect_all_hosts(selected_hosts=selected_host_names)
+            self.host_manager.disconnect_all_hosts(selected_hosts=selected_hosts)
             return False
         
-        start_temps = self.host_manager.get_all_ssd_temperatures(selected_hosts=selected_host_names)
+        start_temps = self.host_manager.get_all_ssd_temperatures(selected_hosts=selected_hosts)
         self._start_temperature_monitor(temp_check_interval)
         
-        cttw_ssd_info = self.host_manager.get_all_ssd_info(selected_hosts=selected_host_names)
+        cttw_ssd_info = self.host_manager.get_all_ssd_info(selected_hosts=selected_hosts)
         
-        with ThreadPoolExecutor(max_workers=len(selected_hosts)) as executor:
-            futures = {executor.submit(self._run_host_test_cttw, host, capacity_percent): host for host in selected_hosts}
-            
-            for future in as_completed(futures):
-                host = futures[future]
-                try:
-                    results = future.result()
-                    self.console_logger.info(f'{host.name} 测试完成')
-                except Exception as e:
-                    self.console_logger.error(f'{host.name} 测试异常: {e}')
+        self._run_on_hosts(selected_hosts, self._run_host_test_cttw, capacity_percent)
         
         self._stop_temperature_monitor()
-        end_temps = self.host_manager.get_all_ssd_temperatures(selected_hosts=selected_host_names)
+        end_temps = self.host_manager.get_all_ssd_temperatures(selected_hosts=selected_hosts)
         test_end_time = datetime.now()
         self._save_temperature_summary(start_temps, end_temps, test_start_time, test_end_time)
         
-        selected_host_names = [host.name for host in selected_hosts]
-        self.host_manager.shutdown_all_hosts(selected_hosts=selected_host_names)
+        self.host_manager.shutdown_all_hosts(selected_hosts=selected_hosts)
         time.sleep(15)
         
-        if not self.host_manager.wait_all_hosts_shutdown(selected_hosts=selected_host_names):
+        if not self.host_manager.wait_all_hosts_shutdown(selected_hosts=selected_hosts):
             self.console_logger.warning('等待主机关机超时')
         
-        self.host_manager.disconnect_all_hosts(selected_hosts=selected_host_names)
+        self.host_manager.disconnect_all_hosts(selected_hosts=selected_hosts)
         
-        test_duration = (test_end_time - test_start_time).total_seconds()
+        test_duration = time.monotonic() - test_t0
         self.console_logger.info(f'测试结束时间: {test_end_time.strftime("%Y-%m-%d %H:%M:%S")}')
         self.console_logger.info(f'测试总耗时: {test_duration:.2f}秒')
         
+        summary_entries = []
         # 检查 cttw_ssd_info 的结构
         if isinstance(cttw_ssd_info, dict):
             first_key = next(iter(cttw_ssd_info.keys()), None)
@@ -1007,9 +980,7 @@ class TestExecutor:
                                 additional_info=ssd_info
                             )
                             
-                            self.result_logger.log_test_result(ssd_sn, 'CTTW', 
-                                                               self.progress.current_temperature, 
-                                                               summary_content, self.test_time, append=True)
+                            summary_entries.append(LogEntry(ssd_sn, 'CTTW', self.progress.current_temperature, summary_content))
                         else:
                             self.console_logger.error(f'[DEBUG] ssd_info 不是字典类型: {ssd_info}')
                 else:
@@ -1030,9 +1001,7 @@ class TestExecutor:
                                         additional_info=ssd_info
                                     )
                                     
-                                    self.result_logger.log_test_result(ssd_sn, 'CTTW', 
-                                                                       self.progress.current_temperature, 
-                                                                       summary_content, self.test_time, append=True)
+                                    summary_entries.append(LogEntry(ssd_sn, 'CTTW', self.progress.current_temperature, summary_content))
                                 else:
                                     self.console_logger.error(f'[DEBUG] ssd_info 不是字典类型: {ssd_info}')
                         else:
@@ -1042,6 +1011,8 @@ class TestExecutor:
         else:
             self.console_logger.error(f'[DEBUG] cttw_ssd_info 不是字典类型: {cttw_ssd_info}')
         
+        self.result_logger.batch_log(summary_entries, self.test_time, append=True)
+        
         self.console_logger.info('CTTW测试完成')
         self._notify_log('CTTW测试完成')
         return True
@@ -1067,62 +1038,52 @@ class TestExecutor:
         self._notify_progress()
         
         test_start_time = datetime.now()
+        test_t0 = time.monotonic()
         self.console_logger.info(f'测试开始时间: {test_start_time.strftime("%Y-%m-%d %H:%M:%S")}')
         
-        selected_hosts = self._get_selected_hosts()
         self.host_manager.wake_selected_hosts(selected_hosts)
         time.sleep(40)
         
-        selected_host_names = [host.name for host in selected_hosts]
-        if not self.host_manager.wait_all_hosts_online(selected_hosts=selected_host_names):
+        if not self.host_manager.wait_all_hosts_online(selected_hosts=selected_hosts):
             self.console_logger.error('等待主机上线超时')
             return False
         
-        if not self.host_manager.connect_all_hosts(selected_hosts=selected_host_names):
+        if not self.host_manager.connect_all_hosts(selected_hosts=selected_hosts):
             self.console_logger.error('连接主机失败')
             return False
         
-        current_ssd_info = self.host_manager.get_all_ssd_info(selected_hosts=selected_host_names)
+        current_ssd_info = self.host_manager.get_all_ssd_info(selected_hosts=selected_hosts)
         
         if not self._check_ssd_consistency(current_ssd_info, test_item='CTTR'):
             self.console_logger.error('SSD信息一致性检查失败')
-            self.host_manager.disconnect_all_hosts(selected_hosts=selected_host_names)
+            self.host_manager.disconnect_all_hosts(selected_hosts=selected_hosts)
             return False
         
-        start_temps = self.host_manager.get_all_ssd_temperatures(selected_hosts=selected_host_names)
+        start_temps = self.host_manager.get_all_ssd_temperatures(selected_hosts=selected_hosts)
         self._start_temperature_monitor(temp_check_interval)
         
-        cttr_ssd_info = self.host_manager.get_all_ssd_info(selected_hosts=selected_host_names)
+        cttr_ssd_info = self.host_manager.get_all_ssd_info(selected_hosts=selected_hosts)
         
-        with ThreadPoolExecutor(max_workers=len(selected_hosts)) as executor:
-            futures = {executor.submit(self._run_host_test_cttr, host, capacity_percent): host for host in selected_hosts}
-            
-            for future in as_completed(futures):
-                host = futures[future]
-                try:
-                    results = future.result()
-                    self.console_logger.info(f'{host.name} 测试完成')
-                except Exception as e:
-                    self.console_logger.error(f'{host.name} 测试异常: {e}')
+        self._run_on_hosts(selected_hosts, self._run_host_test_cttr, capacity_percent)
         
         self._stop_temperature_monitor()
-        end_temps = self.host_manager.get_all_ssd_temperatures(selected_hosts=selected_host_names)
+        end_temps = self.host_manager.get_all_ssd_temperatures(selected_hosts=selected_hosts)
         test_end_time = datetime.now()
         self._save_temperature_summary(start_temps, end_temps, test_start_time, test_end_time)
         
-        selected_host_names = [host.name for host in selected_hosts]
-        self.host_manager.shutdown_all_hosts(selected_hosts=selected_host_names)
+        self.host_manager.shutdown_all_hosts(selected_hosts=selected_hosts)
         time.sleep(15)
         
-        if not self.host_manager.wait_all_hosts_shutdown(selected_hosts=selected_host_names):
+        if not self.host_manager.wait_all_hosts_shutdown(selected_hosts=selected_hosts):
             self.console_logger.warning('等待主机关机超时')
         
-        self.host_manager.disconnect_all_hosts(selected_hosts=selected_host_names)
+        self.host_manager.disconnect_all_hosts(selected_hosts=selected_hosts)
         
-        test_duration = (test_end_time - test_start_time).total_seconds()
+        test_duration = time.monotonic() - test_t0
         self.console_logger.info(f'测试结束时间: {test_end_time.strftime("%Y-%m-%d %H:%M:%S")}')
         self.console_logger.info(f'测试总耗时: {test_duration:.2f}秒')
         
+        summary_entries = []
         # 检查 cttr_ssd_info 的结构
         if isinstance(cttr_ssd_info, dict):
             first_key = next(iter(cttr_ssd_info.keys()), None)
@@ -1143,9 +1104,7 @@ class TestExecutor:
                                 additional_info=ssd_info
                             )
                             
-                            self.result_logger.log_test_result(ssd_sn, 'CTTR', 
-                                                               self.progress.current_temperature, 
-                                                               summary_content, self.test_time, append=True)
+                            summary_entries.append(LogEntry(ssd_sn, 'CTTR', self.progress.current_temperature, summary_content))
                         else:
                             self.console_logger.error(f'[DEBUG] ssd_info 不是字典类型: {ssd_info}')
                 else:
@@ -1166,9 +1125,7 @@ class TestExecutor:
                                         additional_info=ssd_info
                                     )
                                     
-                                    self.result_logger.log_test_result(ssd_sn, 'CTTR', 
-                                                                       self.progress.current_temperature, 
-                                                                       summary_content, self.test_time, append=True)
+                                    summary_entries.append(LogEntry(ssd_sn, 'CTTR', self.progress.current_temperature, summary_content))
                                 else:
                                     self.console_logger.error(f'[DEBUG] ssd_info 不是字典类型: {ssd_info}')
                         else:
@@ -1178,6 +1135,8 @@ class TestExecutor:
         else:
             self.console_logger.error(f'[DEBUG] cttr_ssd_info 不是字典类型: {cttr_ssd_info}')
         
+        self.result_logger.batch_log(summary_entries, self.test_time, append=True)
+        
         self.console_logger.info('CTTR测试完成')
         self._notify_log('CTTR测试完成')
         return True
@@ -1,10 +1,47 @@
 import paramiko
+import re
 import time
+import errno
+import select
 import socket
-from typing import Optional, List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Tuple, Iterable, Union, Callable
 from logger import ConsoleLogger
 
 
+_ID_CTRL_RE = re.compile(r'^[ \t]*(?P<k>mn|sn|vid|did|ssvid|subnqn|model number|serial number)[ \t]*:[ \t]*(?P<v>.+?)[ \t]*\r?$',
+                         re.IGNORECASE | re.MULTILINE)
+_KEY_MAP = {
+    'mn': 'MN',
+    'model number': 'MN',
+    'sn': 'SN',
+    'serial number': 'SN',
+    'vid': 'VID',
+    'did': 'DID',
+    'ssvid': 'SSVID',
+    'subnqn': 'SUBNQN',
+}
+_BATCH_MARKER_RE = re.compile(r'^=== (\S+) ===\r?$', re.MULTILINE)
+_SMART_TEMP_RE = re.compile(r'^temperature\s*:\s*(-?\d+(?:\.\d+)?)', re.IGNORECASE | re.MULTILINE)
+
+_BATCH_ID_CTRL_CMD = ('for d in /dev/nvme*n1; do [ -e "$d" ] || continue; '
+                      'echo "=== $d ==="; nvme id-ctrl "$d"; done')
+# 已缓存身份信息的盘只输出标记行，不再执行 id-ctrl
+_BATCH_ID_CTRL_NEW_CMD = ('for d in /dev/nvme*n1; do [ -e "$d" ] || continue; '
+                          'echo "=== $d ==="; case " {known} " in *" $d "*) ;; *) nvme id-ctrl "$d";; esac; done')
+_LINK_STATUS_CMD = ('echo "addr=$(cat /sys/block/{dev}/device/address 2>/dev/null)"; '
+                    "lspci -vvv -D -d ::0108 | grep -E '^[0-9a-f]|LnkSta:'")
+_BATCH_SMART_CMD = ('for d in /dev/nvme*n1; do [ -e "$d" ] || continue; '
+                    'echo "=== $d ==="; nvme smart-log "$d"; done')
+_CMD_SENTINEL = '__CMD_END__'
+_CMD_ERR_MARKER = '__CMD_ERR__'
+_QUERY_TIMEOUT = 30
+_CMD_SENTINEL_RE = re.compile(_CMD_SENTINEL + r'(\d+)\r?\n')
+# 每条命令的标准输出直接写到 fd 3 (原标准输出)，标准错误单独捕获后输出在错误标记之后，最后输出退出状态
+_CMD_WRAPPER = ('_e=$( {{ {command}; }} 2>&1 1>&3 3>&- ); _s=$?; '
+                'echo "' + _CMD_ERR_MARKER + '"; printf "%s" "$_e"; echo "' + _CMD_SENTINEL + '$_s"')
+
+
 class TestHost:
     def __init__(self, ip: str, mac: str, name: str, username: str = 'root', 
                  password: str = '1', port: int = 22, connect_timeout: int = 30, 
@@ -21,18 +58,26 @@ class TestHost:
         self.ssh_client = None
         self.ssd_list = []
         self.ssd_info = {}
+        self._addr = (ip, 22)
+        try:
+            self._wol_payload = WakeOnLAN.build_payload(mac)
+        except ValueError:
+            self._wol_payload = None
+        self.smart_cache_ttl = 5.0
+        self._smart_cache = {}
 
     def is_online(self) -> bool:
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2)
-            result = sock.connect_ex((self.ip, 22))
-            sock.close()
-            return result == 0
-        except Exception:
+            sock = socket.create_connection(self._addr, timeout=0.5)
+        except OSError:
             return False
+        sock.close()
+        return True
 
     def connect(self, retry_count: int = 3, retry_delay: int = 2) -> bool:
+        # 重启或唤醒期间可能更换了SSD，重新连接后不沿用旧的身份信息
+        self.ssd_info.clear()
+        
         for attempt in range(1, retry_count + 1):
             try:
                 if self.logger:
@@ -123,39 +168,60 @@ class TestHost:
                     return False
 
     def disconnect(self):
+        self.ssd_info.clear()
+        self._smart_cache.clear()
         if self.ssh_client:
             self.ssh_client.close()
             if self.logger:
                 self.logger.info(f'断开测试主机连接: {self.name}')
 
+    def is_ssh_alive(self) -> bool:
+        if not self.ssh_client:
+            return False
+        transport = self.ssh_client.get_transport()
+        return transport is not None and transport.is_active()
+
     def execute_command(self, command: str, timeout: Optional[int] = None) -> Tuple[int, str, str]:
         if timeout is None:
             timeout = self.command_timeout
         
         try:
             stdin, stdout, stderr = self.ssh_client.exec_command(command, timeout=timeout)
+            stdin.close()
+            output = stdout.read().decode('utf-8', errors='replace')
             exit_status = stdout.channel.recv_exit_status()
-            output = stdout.read().decode('utf-8')
-            error = stderr.read().decode('utf-8')
+            error = stderr.read().decode('utf-8', errors='replace') if exit_status != 0 else ''
             return exit_status, output, error
         except Exception as e:
             if self.logger:
                 self.logger.error(f'执行命令失败 [{self.name}]: {command}, 错误: {e}')
             return -1, '', str(e)
 
+    def execute_commands(self, commands: List[str], timeout: Optional[int] = None) -> List[Tuple[int, str, str]]:
+        script = 'exec 3>&1; ' + '; '.join(_CMD_WRAPPER.format(command=command) for command in commands)
+        exit_status, output, error = self.execute_command(script, timeout=timeout)
+        
+        parts = _CMD_SENTINEL_RE.split(output)
+        results = []
+        for i in range(len(commands)):
+            if 2 * i + 1 < len(parts):
+                command_status = int(parts[2 * i + 1])
+                command_output, _, command_error = parts[2 * i].partition(_CMD_ERR_MARKER + '\n')
+                results.append((command_status, command_output, command_error if command_status != 0 else ''))
+            else:
+                results.append((-1, '', error))
+        return results
+
     def get_ssd_list(self) -> List[str]:
         if not self.ssh_client:
             if self.logger:
                 self.logger.warning(f'SSH未连接，无法获取SSD列表 [{self.name}]')
             return []
         
-        exit_status, output, error = self.execute_command('ls /dev/nvme*n1')
+        exit_status, output, error = self.execute_command('ls -1 /dev/nvme*n1 2>/dev/null', timeout=_QUERY_TIMEOUT)
         
         if exit_status == 0:
-            ssds = [line.strip() for line in output.split('\n') 
-                    if line.strip().startswith('/dev/nvme') 
-                    and 'n1' in line]
-            self.ssd_list = list(set(ssds))
+            self.ssd_list = list(dict.fromkeys(output.split()))
             if self.logger:
                 self.logger.info(f'获取SSD列表成功 [{self.name}]: {self.ssd_list}')
             return self.ssd_list
@@ -164,60 +230,114 @@ class TestHost:
                 self.logger.error(f'获取SSD列表失败 [{self.name}]: {error}')
             return []
 
-    def get_ssd_info(self, ssd_path: str) -> Dict[str, str]:
+    def _parse_id_ctrl(self, output: str) -> Dict[str, str]:
+        return {_KEY_MAP[m['k'].lower()]: m['v'] for m in _ID_CTRL_RE.finditer(output)}
+
+    def get_ssd_info(self, ssd_path: str, refresh_identity: bool = False) -> Dict[str, str]:
+        if not refresh_identity and ssd_path in self.ssd_info:
+            return dict(self.ssd_info[ssd_path])
+        return self._ssd_info_from(ssd_path, *self.execute_command(f'nvme id-ctrl {ssd_path}', timeout=_QUERY_TIMEOUT))
+
+    def _ssd_info_from(self, ssd_path: str, exit_status: int, output: str, error: str) -> Dict[str, str]:
         info = {}
-        
-        exit_status, output, error = self.execute_command(f'nvme id-ctrl {ssd_path}')
-        
         if exit_status == 0:
-            lines = output.split('\n')
-            for line in lines:
-                if 'mn' in line.lower() or 'model number' in line.lower():
-                    info['MN'] = line.split(':')[-1].strip()
-                elif 'sn' in line.lower() or 'serial number' in line.lower():
-                    info['SN'] = line.split(':')[-1].strip()
-                elif 'vid' in line.lower():
-                    info['VID'] = line.split(':')[-1].strip()
-                elif 'did' in line.lower():
-                    info['DID'] = line.split(':')[-1].strip()
+            info = self._parse_id_ctrl(output)
+            if info:
+                self.ssd_info[ssd_path] = dict(info)
         
         if self.logger:
             self.logger.info(f'获取SSD信息成功 [{self.name}] {ssd_path}: {info}')
         return info
 
+    def _run_batch(self, command: str) -> Dict[str, str]:
+        exit_status, output, error = self.execute_command(command, timeout=_QUERY_TIMEOUT)
+        
+        if exit_status != 0 and not output:
+            if self.logger:
+                self.logger.error(f'批量执行命令失败 [{self.name}]: {error}')
+            return {}
+        
+        parts = _BATCH_MARKER_RE.split(output)
+        return dict(zip(parts[1::2], parts[2::2]))
+
+    def get_all_ssd_info_batch(self, refresh_identity: bool = False) -> Dict[str, Dict[str, str]]:
+        if refresh_identity or not self.ssd_info:
+            command = _BATCH_ID_CTRL_CMD
+        else:
+            command = _BATCH_ID_CTRL_NEW_CMD.format(known=' '.join(self.ssd_info))
+        
+        all_info = {}
+        for ssd_path, block in self._run_batch(command).items():
+            cached_info = None if refresh_identity else self.ssd_info.get(ssd_path)
+            if cached_info is not None and not block.strip():
+                all_info[ssd_path] = dict(cached_info)
+                continue
+            all_info[ssd_path] = self._parse_id_ctrl(block)
+            if all_info[ssd_path]:
+                self.ssd_info[ssd_path] = dict(all_info[ssd_path])
+        
+        # 已拔出的盘不再保留缓存
+        for ssd_path in [path for path in self.ssd_info if path not in all_info]:
+            del self.ssd_info[ssd_path]
+        
+        self.ssd_list = list(all_info)
+        if self.logger:
+            self.logger.info(f'批量获取SSD信息成功 [{self.name}]: {all_info}')
+        return all_info
+
+    def get_all_ssd_temperatures_batch(self) -> Dict[str, float]:
+        temps = {}
+        now = time.monotonic()
+        for ssd_path, block in self._run_batch(_BATCH_SMART_CMD).items():
+            temp = self._parse_temperature(block)
+            if temp is not None:
+                # 只缓存能解析出温度的输出，smart-log 失败时下次单独查询重新执行命令
+                self._smart_cache[ssd_path] = (now, block)
+                temps[ssd_path] = temp
+            elif self.logger:
+                self.logger.error(f'解析SSD温度失败 [{self.name}] {ssd_path}')
+        return temps
+
     def get_ssd_link_status(self, ssd_path: str) -> Dict[str, str]:
+        dev = ssd_path.rsplit('/', 1)[-1]
+        return self._link_status_from(ssd_path, *self.execute_command(_LINK_STATUS_CMD.format(dev=dev), timeout=_QUERY_TIMEOUT))
+
+    def _link_status_from(self, ssd_path: str, exit_status: int, output: str, error: str) -> Dict[str, str]:
         link_info = {}
         
         try:
-            print(f"[DEBUG] get_ssd_link_status 开始执行: {self.name}, {ssd_path}")
-            exit_status, output, error = self.execute_command(f'lspci -vvv -d ::0108')
-            
-            print(f"[DEBUG] 执行命令结果: exit_status={exit_status}, output长度={len(output) if output else 0}, error={error}")
-            
             if exit_status == 0:
-                lines = output.split('\n')
-                print(f"[DEBUG] 输出行数: {len(lines)}")
-                for i, line in enumerate(lines):
-                    if 'LnkSta:' in line:
-                        print(f"[DEBUG] 找到LnkSta行 ({i}): {line.strip()}")
-                        link_info['link'] = line.strip()
-                        break
-            else:
-                print(f"[DEBUG] 命令执行失败: {error}")
+                address = None
+                current = None
+                links = {}
+                for line in output.splitlines():
+                    if line.startswith('addr='):
+                        address = line[5:].strip()
+                    elif line[:1].isspace():
+                        if current is not None:
+                            links.setdefault(current, line.strip())
+                    elif line:
+                        current = line.split(None, 1)[0]
+                
+                link = links.get(address) or next(iter(links.values()), None)
+                if link:
+                    link_info['link'] = link
+            elif self.logger:
+                self.logger.warning(f'获取SSD链路状态失败 [{self.name}] {ssd_path}: {error}')
         except Exception as e:
-            print(f"[DEBUG] 异常: {e}")
             if self.logger:
                 self.logger.warning(f'获取SSD链路状态失败 [{self.name}] {ssd_path}: {e}')
         
-        print(f"[DEBUG] 最终link_info: {link_info}, 类型: {type(link_info).__name__}")
         if self.logger:
             self.logger.info(f'获取SSD链路状态成功 [{self.name}] {ssd_path}: {link_info}')
         return link_info
 
     def get_ssd_smart(self, ssd_path: str) -> str:
-        exit_status, output, error = self.execute_command(f'nvme smart-log {ssd_path}')
-        
+        return self._smart_from(ssd_path, *self.execute_command(f'nvme smart-log {ssd_path}', timeout=_QUERY_TIMEOUT))
+
+    def _smart_from(self, ssd_path: str, exit_status: int, output: str, error: str) -> str:
         if exit_status == 0:
+            self._smart_cache[ssd_path] = (time.monotonic(), output)
             if self.logger:
                 self.logger.info(f'获取SSD SMART信息成功 [{self.name}] {ssd_path}')
             return output
@@ -226,20 +346,45 @@ class TestHost:
                 self.logger.error(f'获取SSD SMART信息失败 [{self.name}] {ssd_path}: {error}')
             return ''
 
-    def get_ssd_temperature(self, ssd_path: str) -> Optional[float]:
-        exit_status, output, error = self.execute_command(f'nvme smart-log {ssd_path} | grep temperature')
+    def get_ssd_snapshot(self, ssd_path: str, refresh_identity: bool = False) -> Tuple[Dict[str, str], Dict[str, str], str]:
+        dev = ssd_path.rsplit('/', 1)[-1]
+        cached_info = None if refresh_identity else self.ssd_info.get(ssd_path)
         
-        if exit_status == 0:
-            try:
-                temp_str = output.split(':')[-1].strip()
-                temperature = float(temp_str.split()[0])
-                return temperature
-            except Exception as e:
-                if self.logger:
-                    self.logger.error(f'解析SSD温度失败 [{self.name}] {ssd_path}: {e}')
+        commands = [_LINK_STATUS_CMD.format(dev=dev), f'nvme smart-log {ssd_path}']
+        if cached_info is None:
+            commands.insert(0, f'nvme id-ctrl {ssd_path}')
+        results = self.execute_commands(commands, timeout=_QUERY_TIMEOUT)
         
+        if cached_info is None:
+            info = self._ssd_info_from(ssd_path, *results.pop(0))
+        else:
+            info = dict(cached_info)
+        link_result, smart_result = results
+        return (info,
+                self._link_status_from(ssd_path, *link_result),
+                self._smart_from(ssd_path, *smart_result))
+
+    def _parse_temperature(self, smart_output: str) -> Optional[float]:
+        match = _SMART_TEMP_RE.search(smart_output)
+        if match:
+            return float(match.group(1))
         return None
 
+    def get_ssd_temperature(self, ssd_path: str) -> Optional[float]:
+        cached = self._smart_cache.get(ssd_path)
+        if cached and time.monotonic() - cached[0] < self.smart_cache_ttl:
+            smart_output = cached[1]
+        else:
+            smart_output = self.get_ssd_smart(ssd_path)
+        
+        if not smart_output:
+            return None
+        
+        temperature = self._parse_temperature(smart_output)
+        if temperature is None and self.logger:
+            self.logger.error(f'解析SSD温度失败 [{self.name}] {ssd_path}')
+        return temperature
+
     def run_fio_test(self, ssd_path: str, fio_command: str) -> Tuple[int, str, str]:
         full_command = fio_command.replace('$i', ssd_path)
         return self.execute_command(full_command)
@@ -265,30 +410,72 @@ class TestHost:
 
 
 class WakeOnLAN:
-    @staticmethod
-    def send_wol(mac_address: str, ip_address: str = '255.255.255.255', port: int = 9) -> bool:
-        try:
-            mac_address = mac_address.replace('-', ':').replace('.', ':')
-            mac_bytes = bytes.fromhex(mac_address.replace(':', ''))
-            
-            payload = b'\xff' * 6 + mac_bytes * 16
-            
+    def __init__(self, port: int = 9):
+        self.port = port
+        self.sock = None
+
+    def open(self):
+        if self.sock is None:
             sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            sock.sendto(payload, (ip_address, port))
-            sock.close()
-            
+            self.sock = sock
+
+    def close(self):
+        if self.sock:
+            self.sock.close()
+            self.sock = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @staticmethod
+    def build_payload(mac_address: str) -> bytes:
+        mac_address = mac_address.replace('-', ':').replace('.', ':')
+        mac_bytes = bytes.fromhex(mac_address.replace(':', ''))
+        return b'\xff' * 6 + mac_bytes * 16
+
+    def send_payload(self, payload: bytes, ip_address: str = '255.255.255.255') -> bool:
+        try:
+            self.sock.sendto(payload, (ip_address, self.port))
             return True
         except Exception as e:
             print(f'发送WOL命令失败: {e}')
             return False
 
+    def send_wol_batch(self, targets: List[Tuple[str, str]]) -> List[bool]:
+        results = []
+        for mac_address, ip_address in targets:
+            try:
+                payload = self.build_payload(mac_address)
+            except ValueError as e:
+                print(f'发送WOL命令失败: {e}')
+                results.append(False)
+                continue
+            results.append(self.send_payload(payload, ip_address))
+        return results
+
+    @staticmethod
+    def send_wol(mac_address: str, ip_address: str = '255.255.255.255', port: int = 9) -> bool:
+        try:
+            with WakeOnLAN(port) as wol:
+                return wol.send_wol_batch([(mac_address, ip_address)])[0]
+        except Exception as e:
+            print(f'发送WOL命令失败: {e}')
+            return False
+
 
 class TestHostManager:
     def __init__(self, hosts_config, logger: Optional[ConsoleLogger] = None):
         self.hosts = []
         self.logger = logger
         self._init_hosts(hosts_config)
+        self._name_index = {host.name: host for host in self.hosts}
+        self._pool = ThreadPoolExecutor(max_workers=64)
+        self._wol = WakeOnLAN()
 
     def _init_hosts(self, hosts_config):
         for config in hosts_config:
@@ -313,50 +500,113 @@ class TestHostManager:
             if host is not None:
                 self.hosts.append(host)
 
-    def wake_all_hosts(self):
-        for host in self.hosts:
-            success = WakeOnLAN.send_wol(host.mac)
+    def _resolve_hosts(self, selected_hosts: Optional[Iterable[Union[TestHost, str]]] = None) -> List[TestHost]:
+        if selected_hosts is None:
+            return self.hosts
+        
+        hosts = {}
+        for host in selected_hosts:
+            if isinstance(host, str):
+                host = self._name_index.get(host)
+            if host is not None:
+                hosts.setdefault(host.name, host)
+        return list(hosts.values())
+
+    def _map_hosts(self, func: Callable, hosts: List[TestHost]) -> List:
+        if len(hosts) <= 1:
+            return [func(host) for host in hosts]
+        
+        return list(self._pool.map(func, hosts))
+
+    def _connected_hosts(self, hosts: List[TestHost], warning: Optional[str] = None) -> List[TestHost]:
+        connected = []
+        for host in hosts:
+            if host.is_ssh_alive():
+                connected.append(host)
+            elif self.logger and warning:
+                self.logger.warning(f'{warning} [{host.name}]')
+        return connected
+
+    def _read_host_ssd_info(self, host: TestHost) -> Dict[str, Dict]:
+        host_ssd_info = {}
+        for ssd_path, ssd_info in host.get_all_ssd_info_batch().items():
+            ssd_sn = ssd_info.get('SN', 'unknown')
+            ssd_info['host'] = host.name
+            ssd_info['path'] = ssd_path
+            host_ssd_info[ssd_sn] = ssd_info
+        return host_ssd_info
+
+    def _wake_hosts(self, hosts: List[TestHost]):
+        try:
+            self._wol.open()
+            results = [host._wol_payload is not None and self._wol.send_payload(host._wol_payload)
+                       for host in hosts]
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f'创建WOL广播套接字失败: {e}')
+            results = [False] * len(hosts)
+        
+        for host, success in zip(hosts, results):
             if success:
                 if self.logger:
                     self.logger.info(f'发送WOL命令成功: {host.name}')
             else:
                 if self.logger:
                     self.logger.error(f'发送WOL命令失败: {host.name}')
+
+    def close(self):
+        self._wol.close()
+        self._pool.shutdown(wait=False)
+
+    def wake_all_hosts(self):
+        self._wake_hosts(self.hosts)
     
-    def wake_selected_hosts(self, selected_hosts: List):
-        for host in selected_hosts:
-            if isinstance(host, str):
-                host_name = host
-                for h in self.hosts:
-                    if h.name == host_name:
-                        success = WakeOnLAN.send_wol(h.mac)
-                        if success:
-                            if self.logger:
-                                self.logger.info(f'发送WOL命令成功: {host_name}')
-                        else:
-                            if self.logger:
-                                self.logger.error(f'发送WOL命令失败: {host_name}')
-                        break
+    def wake_selected_hosts(self, selected_hosts: Iterable[Union[TestHost, str]]):
+        self._wake_hosts(self._resolve_hosts(selected_hosts))
+    
+    def probe_online_all(self, hosts: Iterable[TestHost], timeout: float = 0.5) -> Dict[str, bool]:
+        status = {}
+        pending = {}
+        for host in hosts:
+            status[host.name] = False
+            sock = None
+            try:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                result = sock.connect_ex(host._addr)
+            except Exception:
+                if sock is not None:
+                    sock.close()
+                continue
+            
+            if result in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                pending[sock] = host.name
             else:
-                success = WakeOnLAN.send_wol(host.mac)
-                if success:
-                    if self.logger:
-                        self.logger.info(f'发送WOL命令成功: {host.name}')
-                else:
-                    if self.logger:
-                        self.logger.error(f'发送WOL命令失败: {host.name}')
+                status[host.name] = result == 0
+                sock.close()
+        
+        deadline = time.monotonic() + timeout
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                _, writable, _ = select.select([], list(pending), [], remaining)
+                for sock in writable:
+                    host_name = pending.pop(sock)
+                    status[host_name] = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                    sock.close()
+        finally:
+            for sock in pending:
+                sock.close()
+        
+        return status
     
     def wait_all_hosts_online(self, wait_time: int = 40, check_interval: int = 2, 
-                          selected_hosts: Optional[List] = None) -> bool:
+                          selected_hosts: Optional[Iterable[Union[TestHost, str]]] = None) -> bool:
         start_time = time.time()
         
-        if selected_hosts is None:
-            hosts_to_check = self.hosts
-        else:
-            hosts_to_check = []
-            for host in self.hosts:
-                if host.name in selected_hosts:
-                    hosts_to_check.append(host)
+        hosts_to_check = self._resolve_hosts(selected_hosts)
         
         if self.logger:
             self.logger.info(f'开始等待主机上线，超时时间: {wait_time}秒，检查间隔: {check_interval}秒')
@@ -366,14 +616,16 @@ class TestHostManager:
             online_hosts = []
             offline_hosts = []
             
+            round_start = time.monotonic()
+            remaining = wait_time - (time.time() - start_time)
+            status = self.probe_online_all(hosts_to_check, timeout=max(0.5, min(check_interval, remaining)))
             for host in hosts_to_check:
-                is_online = host.is_online()
-                if is_online:
+                if status[host.name]:
                     online_hosts.append(host.name)
                 else:
                     offline_hosts.append(host.name)
             
-            all_online = all(host.is_online() for host in hosts_to_check)
+            all_online = not offline_hosts
             
             if self.logger:
                 self.logger.info(f'主机状态检查 - 在线: {online_hosts}, 离线: {offline_hosts}')
@@ -383,7 +635,7 @@ class TestHostManager:
                     self.logger.info('所有选中的测试主机已上线')
                 return True
             
-            time.sleep(check_interval)
+            time.sleep(max(0, check_interval - (time.monotonic() - round_start)))
         
         if self.logger:
             self.logger.warning(f'等待主机上线超时，超时时间: {wait_time}秒')
@@ -396,14 +648,8 @@ class TestHostManager:
         
         return False
 
-    def connect_all_hosts(self, selected_hosts: Optional[List] = None) -> bool:
-        if selected_hosts is None:
-            hosts_to_connect = self.hosts
-        else:
-            hosts_to_connect = []
-            for host in self.hosts:
-                if host.name in selected_hosts:
-                    hosts_to_connect.append(host)
+    def connect_all_hosts(self, selected_hosts: Optional[Iterable[Union[TestHost, str]]] = None) -> bool:
+        hosts_to_connect = self._resolve_hosts(selected_hosts)
         
         all_connected = True
         
@@ -411,11 +657,13 @@ class TestHostManager:
             self.logger.info(f'开始连接主机，共{len(hosts_to_connect)}台')
             self.logger.info(f'连接主机列表: {[f"{host.name}({host.ip})" for host in hosts_to_connect]}')
         
-        for host in hosts_to_connect:
+        def connect_host(host: TestHost) -> bool:
             if self.logger:
                 self.logger.info(f'正在连接主机: {host.name} ({host.ip})')
-            
-            if not host.connect():
+            return host.connect()
+        
+        for host, connected in zip(hosts_to_connect, self._map_hosts(connect_host, hosts_to_connect)):
+            if not connected:
                 all_connected = False
                 if self.logger:
                     self.logger.error(f'主机连接失败: {host.name} ({host.ip})')
@@ -432,26 +680,14 @@ class TestHostManager:
         
         return all_connected
 
-    def disconnect_all_hosts(self, selected_hosts: Optional[List] = None):
-        if selected_hosts is None:
-            hosts_to_disconnect = self.hosts
-        else:
-            hosts_to_disconnect = []
-            for host in self.hosts:
-                if host.name in selected_hosts:
-                    hosts_to_disconnect.append(host)
+    def disconnect_all_hosts(self, selected_hosts: Optional[Iterable[Union[TestHost, str]]] = None):
+        hosts_to_disconnect = self._resolve_hosts(selected_hosts)
         
         for host in hosts_to_disconnect:
             host.disconnect()
 
-    def shutdown_all_hosts(self, selected_hosts: Optional[List] = None) -> bool:
-        if selected_hosts is None:
-            hosts_to_shutdown = self.hosts
-        else:
-            hosts_to_shutdown = []
-            for host in self.hosts:
-                if host.name in selected_hosts:
-                    hosts_to_shutdown.append(host)
+    def shutdown_all_hosts(self, selected_hosts: Optional[Iterable[Union[TestHost, str]]] = None) -> bool:
+        hosts_to_shutdown = self._resolve_hosts(selected_hosts)
         
         all_shutdown = True
         
@@ -459,8 +695,9 @@ class TestHostManager:
             self.logger.info(f'开始关机，共{len(hosts_to_shutdown)}台')
             self.logger.info(f'关机主机列表: {[host.name for host in hosts_to_shutdown]}')
         
-        for host in hosts_to_shutdown:
-            if not host.shutdown():
+        results = self._map_hosts(TestHost.shutdown, hosts_to_shutdown)
+        for host, success in zip(hosts_to_shutdown, results):
+            if not success:
                 all_shutdown = False
                 if self.logger:
                     self.logger.error(f'主机关机失败: {host.name}')
@@ -478,16 +715,10 @@ class TestHostManager:
         return all_shutdown
 
     def wait_all_hosts_shutdown(self, wait_time: int = 15, check_interval: int = 2,
-                            selected_hosts: Optional[List] = None) -> bool:
+                            selected_hosts: Optional[Iterable[Union[TestHost, str]]] = None) -> bool:
         start_time = time.time()
         
-        if selected_hosts is None:
-            hosts_to_check = self.hosts
-        else:
-            hosts_to_check = []
-            for host in self.hosts:
-                if host.name in selected_hosts:
-                    hosts_to_check.append(host)
+        hosts_to_check = self._resolve_hosts(selected_hosts)
         
         if self.logger:
             self.logger.info(f'开始等待主机关机，超时时间: {wait_time}秒，检查间隔: {check_interval}秒')
@@ -497,14 +728,14 @@ class TestHostManager:
             online_hosts = []
             shutdown_hosts = []
             
-            for host in hosts_to_check:
-                is_shutdown = host.is_shutdown()
+            statuses = self._map_hosts(TestHost.is_shutdown, hosts_to_check)
+            for host, is_shutdown in zip(hosts_to_check, statuses):
                 if is_shutdown:
                     shutdown_hosts.append(host.name)
                 else:
                     online_hosts.append(host.name)
             
-            all_shutdown = all(host.is_shutdown() for host in hosts_to_check)
+            all_shutdown = not online_hosts
             
             if self.logger:
                 self.logger.info(f'主机状态检查 - 已关机: {shutdown_hosts}, 仍在线: {online_hosts}')
@@ -522,69 +753,45 @@ class TestHostManager:
         
         return False
 
-    def get_all_ssd_info(self, selected_hosts: Optional[List] = None, silent: bool = False) -> Dict[str, Dict]:
-        if selected_hosts is None:
-            hosts_to_check = self.hosts
-        else:
-            hosts_to_check = []
-            for host in self.hosts:
-                if host.name in selected_hosts:
-                    hosts_to_check.append(host)
+    def get_all_ssd_info(self, selected_hosts: Optional[Iterable[Union[TestHost, str]]] = None, silent: bool = False) -> Dict[str, Dict]:
+        hosts_to_check = self._resolve_hosts(selected_hosts)
         
         all_ssd_info = {}
         
         if self.logger and not silent:
             self.logger.info(f'获取SSD信息，共{len(hosts_to_check)}台主机')
         
-        for host in hosts_to_check:
-            if not host.ssh_client:
-                if self.logger and not silent:
-                    self.logger.warning(f'SSH未连接，跳过获取SSD信息 [{host.name}]')
-                continue
-            
-            ssd_list = host.get_ssd_list()
-            for ssd_path in ssd_list:
-                ssd_info = host.get_ssd_info(ssd_path)
-                ssd_sn = ssd_info.get('SN', 'unknown')
-                ssd_info['host'] = host.name
-                ssd_info['path'] = ssd_path
-                all_ssd_info[ssd_sn] = ssd_info
+        connected_hosts = self._connected_hosts(hosts_to_check, None if silent else 'SSH未连接，跳过获取SSD信息')
+        for host_ssd_info in self._map_hosts(self._read_host_ssd_info, connected_hosts):
+            all_ssd_info.update(host_ssd_info)
         
         if self.logger and not silent:
             self.logger.info(f'获取SSD信息完成，共{len(all_ssd_info)}个SSD')
         
         return all_ssd_info
     
-    def connect_selected_hosts(self, selected_hosts: List[str]) -> bool:
-        print(f"[DEBUG] connect_selected_hosts 开始执行")
-        print(f"[DEBUG] selected_hosts: {selected_hosts}")
-        print(f"[DEBUG] self.hosts数量: {len(self.hosts)}")
-        
+    def connect_selected_hosts(self, selected_hosts: Iterable[Union[TestHost, str]]) -> bool:
+        selected_hosts = list(selected_hosts)
         all_connected = True
         
         if self.logger:
             self.logger.info(f'开始连接选中的主板，共{len(selected_hosts)}台')
             self.logger.info(f'连接主板列表: {selected_hosts}')
         
-        for host in self.hosts:
-            print(f"[DEBUG] 检查 host: {host.name}, ip={host.ip}")
-            if host.name in selected_hosts:
-                print(f"[DEBUG] host {host.name} 在 selected_hosts 中，开始连接")
+        hosts_to_connect = self._resolve_hosts(selected_hosts)
+        for host in hosts_to_connect:
+            if self.logger:
+                self.logger.info(f'正在连接主板: {host.name} ({host.ip}:{host.port})')
+        
+        results = self._map_hosts(lambda host: host.connect(retry_count=3, retry_delay=2), hosts_to_connect)
+        for host, success in zip(hosts_to_connect, results):
+            if success:
                 if self.logger:
-                    self.logger.info(f'正在连接主板: {host.name} ({host.ip}:{host.port})')
-                
-                success = host.connect(retry_count=3, retry_delay=2)
-                print(f"[DEBUG] host {host.name} 连接结果: {success}")
-                
-                if success:
-                    if self.logger:
-                        self.logger.info(f'主板连接成功: {host.name}')
-                else:
-                    if self.logger:
-                        self.logger.error(f'主板连接失败: {host.name}')
-                    all_connected = False
+                    self.logger.info(f'主板连接成功: {host.name}')
             else:
-                print(f"[DEBUG] host {host.name} 不在 selected_hosts 中，跳过")
+                if self.logger:
+                    self.logger.error(f'主板连接失败: {host.name}')
+                all_connected = False
         
         if self.logger:
             if all_connected:
@@ -592,72 +799,25 @@ class TestHostManager:
             else:
                 self.logger.error(f'部分或全部选中的主板连接失败')
         
-        print(f"[DEBUG] connect_selected_hosts 返回值: {all_connected}")
         return all_connected
     
-    def get_selected_ssd_info(self, selected_hosts: List[str]) -> Dict[str, Dict]:
-        print(f"[DEBUG] get_selected_ssd_info 开始执行")
-        print(f"[DEBUG] selected_hosts: {selected_hosts}")
-        print(f"[DEBUG] self.hosts数量: {len(self.hosts)}")
-        
+    def get_selected_ssd_info(self, selected_hosts: Iterable[Union[TestHost, str]]) -> Dict[str, Dict]:
+        selected_hosts = list(selected_hosts)
         all_ssd_info = {}
         
-        if self.logger and not False:
+        if self.logger:
             self.logger.info(f'获取选中的主板SSD信息，共{len(selected_hosts)}台')
         
-        for host in self.hosts:
-            print(f"[DEBUG] 检查 host: {host.name}, ip={host.ip}")
-            if host.name in selected_hosts:
-                print(f"[DEBUG] host {host.name} 在 selected_hosts 中")
-                if not host.ssh_client:
-                    print(f"[DEBUG] host {host.name} SSH未连接")
-                    if self.logger:
-                        self.logger.warning(f'SSH未连接，跳过获取SSD信息 [{host.name}]')
-                    continue
-                
-                print(f"[DEBUG] host {host.name} SSH已连接，获取SSD列表")
-                ssd_list = host.get_ssd_list()
-                print(f"[DEBUG] host {host.name} SSD列表: {ssd_list}")
-                
-                for ssd_path in ssd_list:
-                    print(f"[DEBUG] 获取SSD信息: {ssd_path}")
-                    ssd_info = host.get_ssd_info(ssd_path)
-                    print(f"[DEBUG] SSD info: {ssd_info}")
-                    
-                    ssd_sn = ssd_info.get('SN', 'unknown')
-                    ssd_info['host'] = host.name
-                    ssd_info['path'] = ssd_path
-                    all_ssd_info[ssd_sn] = ssd_info
-                    print(f"[DEBUG] 添加SSD到all_ssd_info: key={ssd_sn}")
-            else:
-                print(f"[DEBUG] host {host.name} 不在 selected_hosts 中，跳过")
+        hosts_to_check = self._connected_hosts(self._resolve_hosts(selected_hosts), 'SSH未连接，跳过获取SSD信息')
+        
+        for host_ssd_info in self._map_hosts(self._read_host_ssd_info, hosts_to_check):
+            all_ssd_info.update(host_ssd_info)
         
-        print(f"[DEBUG] all_ssd_info: {all_ssd_info}")
-        print(f"[DEBUG] all_ssd_info keys: {list(all_ssd_info.keys())}")
-        print(f"[DEBUG] get_selected_ssd_info 返回值: {all_ssd_info}")
         return all_ssd_info
 
-    def get_all_ssd_temperatures(self, selected_hosts: Optional[List] = None) -> Dict[str, Dict[str, float]]:
-        if selected_hosts is None:
-            hosts_to_check = self.hosts
-        else:
-            hosts_to_check = []
-            for host in self.hosts:
-                if host.name in selected_hosts:
-                    hosts_to_check.append(host)
-        
-        all_temps = {}
-        for host in hosts_to_check:
-            if not host.ssh_client:
-                if self.logger:
-                    self.logger.warning(f'SSH未连接，跳过获取SSD温度 [{host.name}]')
-                continue
-            
-            ssd_list = host.get_ssd_list()
-            host_temps = {}
-            for ssd_path in ssd_list:
-                temp = host.get_ssd_temperature(ssd_path)
-                if temp is not None:
-                    host_temps[ssd_path] = temp
-            all_temps[host.name] = host_temps
-        return all_temps
+    def get_all_ssd_temperatures(self, selected_hosts: Optional[Iterable[Union[TestHost, str]]] = None) -> Dict[str, Dict[str, float]]:
+        hosts_to_check = self._resolve_hosts(selected_hosts)
+        
+        connected_hosts = self._connected_hosts(hosts_to_check, 'SSH未连接，跳过获取SSD温度')
+        host_temps = self._map_hosts(TestHost.get_all_ssd_temperatures_batch, connected_hosts)
+        return {host.name: temps for host, temps in zip(connected_hosts, host_temps)}
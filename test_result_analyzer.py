@@ -1,9 +1,45 @@
+import contextlib
+import mmap
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from logger import ConsoleLogger
 
+_PCT_RE = re.compile(
+    r'第(?P<cycle>\d+)轮'
+    r'|IOPS\s*:\s*(?P<iops>[\d.]+[kK]?)'
+    r'|(?i:bw\s*[:=]\s*(?P<bandwidth>[\d.]+[KMGT]?B/s))'
+    r'|(?i:lat\s*\([^)]+\)\s*[:=]\s*(?P<latency>[\d.]+[mu]s))'
+)
+_PCT_FIELDS = ('cycle', 'iops', 'bandwidth', 'latency')
+_MARKER_RE = re.compile(rb'(?P<error>error)|(?P<fail>fail)|(?P<verify>verify)', re.IGNORECASE)
+_EXIT_OK = '退出状态: 0'.encode('utf-8')
+# 温度日志按字节匹配(行内需有 ':'): 字段内不允许出现 ':'、换行或 '°C' (UTF-8 为 \xc2\xb0C)
+# 温度取第一个 '°C' 之前最后一个 ':' 之后的内容；其前至少有两个字段时前两个字段为时间戳，
+# 只有一个字段时(如 '开始温度: 45.0°C')没有时间戳
+_TEMP_FIELD = rb'(?:[^:\n\xc2]|\xc2(?!\xb0C))*'
+_TEMP_LINE_RE = re.compile(
+    rb'^(?=[^\n]*:)(?:(' + _TEMP_FIELD + rb':' + _TEMP_FIELD + rb'):)?'
+    rb'(?:' + _TEMP_FIELD + rb':)*(' + _TEMP_FIELD + rb')\xc2\xb0C',
+    re.MULTILINE
+)
+_ERROR_SEP = '-' * 50
+_ERROR_LABELS = {'错误类型': 'type', '错误信息': 'message', '错误时间': 'timestamp'}
+_MAX_ANALYZE_WORKERS = 32
+
+
+def _iter_sections(content: str, sep: str):
+    start = 0
+    while True:
+        end = content.find(sep, start)
+        if end == -1:
+            yield content[start:]
+            return
+        yield content[start:end]
+        start = end + len(sep)
+
 
 class TestResultAnalyzer:
     def __init__(self, config: Dict, logger: Optional[ConsoleLogger] = None):
@@ -12,6 +48,21 @@ class TestResultAnalyzer:
         self.analysis_config = config.get('analysis', {})
         self.max_temperature = self.analysis_config.get('max_temperature', 85)
         self.min_temperature = self.analysis_config.get('min_temperature', -45)
+        self._dir_cache: Dict[str, Tuple[int, List[os.DirEntry]]] = {}
+
+    def _ls(self, path: str) -> List[os.DirEntry]:
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._dir_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        with os.scandir(path) as it:
+            entries = list(it)
+        self._dir_cache[path] = (mtime, entries)
+        return entries
+
+    def invalidate_dir_cache(self):
+        self._dir_cache.clear()
 
     def analyze_test_result(self, test_time: str, test_log_dir: str) -> Dict:
         analysis_result = {
@@ -29,18 +80,35 @@ class TestResultAnalyzer:
                 self.logger.error(f'测试日志目录不存在: {test_time_dir}')
             return analysis_result
         
-        for ssd_sn in os.listdir(test_time_dir):
-            ssd_dir = os.path.join(test_time_dir, ssd_sn)
+        ssd_dirs = [(entry.name, entry.path) for entry in self._ls(test_time_dir)
+                    if entry.is_dir(follow_symlinks=False)]
+        
+        if len(ssd_dirs) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(ssd_dirs), _MAX_ANALYZE_WORKERS)) as executor:
+                futures = [(ssd_sn, executor.submit(self._analyze_ssd_results, ssd_sn, ssd_dir, test_time))
+                           for ssd_sn, ssd_dir in ssd_dirs]
+                ssd_results = [(ssd_sn, future.result()) for ssd_sn, future in futures]
+        else:
+            ssd_results = [(ssd_sn, self._analyze_ssd_results(ssd_sn, ssd_dir, test_time))
+                           for ssd_sn, ssd_dir in ssd_dirs]
+        
+        results_by_sn = analysis_result['ssd_results']
+        overall_status = 'PASS'
+        error_count = 0
+        warning_count = 0
+        
+        for ssd_sn, ssd_result in ssd_results:
+            results_by_sn[ssd_sn] = ssd_result
             
-            if os.path.isdir(ssd_dir):
-                ssd_result = self._analyze_ssd_results(ssd_sn, ssd_dir, test_time)
-                analysis_result['ssd_results'][ssd_sn] = ssd_result
-                
-                if ssd_result['status'] == 'FAIL':
-                    analysis_result['overall_status'] = 'FAIL'
-                    analysis_result['error_count'] += ssd_result['error_count']
-                
-                analysis_result['warning_count'] += ssd_result['warning_count']
+            if ssd_result['status'] == 'FAIL':
+                overall_status = 'FAIL'
+                error_count += ssd_result['error_count']
+            
+            warning_count += ssd_result['warning_count']
+        
+        analysis_result['overall_status'] = overall_status
+        analysis_result['error_count'] = error_count
+        analysis_result['warning_count'] = warning_count
         
         return analysis_result
 
@@ -55,41 +123,57 @@ class TestResultAnalyzer:
             'warning_count': 0
         }
         
-        error_file = os.path.join(ssd_dir, f'{test_time}-{ssd_sn}-error.txt')
-        
-        if os.path.exists(error_file):
-            with open(error_file, 'r', encoding='utf-8') as f:
-                error_content = f.read()
-            
-            error_sections = error_content.split('-' * 50)
+        error_name = f'{test_time}-{ssd_sn}-error.txt'
+        temp_name = f'{test_time}-{ssd_sn}-temperature.txt'
+        error_file = None
+        temp_file = None
+        log_files = []
+        
+        for entry in self._ls(ssd_dir):
+            name = entry.name
+            if name == error_name:
+                error_file = entry.path
+            elif name == temp_name:
+                temp_file = entry.path
+            elif name.startswith(test_time) and name.endswith('.txt'):
+                log_files.append((name, entry.path))
+        
+        if error_file:
+            try:
+                with open(error_file, 'rb') as f:
+                    error_content = f.read().decode('utf-8')
+            except FileNotFoundError:
+                error_content = ''
             
-            for section in error_sections:
+            for section in _iter_sections(error_content, _ERROR_SEP):
                 if section.strip():
                     error_info = self._parse_error_section(section)
                     if error_info:
                         ssd_result['errors'].append(error_info)
                         ssd_result['error_count'] += 1
         
-        for filename in os.listdir(ssd_dir):
-            if filename.startswith(test_time) and filename.endswith('.txt'):
-                test_item = self._extract_test_item_from_filename(filename)
+        for filename, filepath in log_files:
+            test_item = self._extract_test_item_from_filename(filename)
+            
+            if test_item and test_item not in ['info', 'smart', 'temperature', 'error']:
+                test_result = self._analyze_test_item(filepath, test_item)
+                ssd_result['test_items'][test_item] = test_result
                 
-                if test_item and test_item not in ['info', 'smart', 'temperature', 'error']:
-                    filepath = os.path.join(ssd_dir, filename)
-                    test_result = self._analyze_test_item(filepath, test_item)
-                    ssd_result['test_items'][test_item] = test_result
-                    
-                    if test_result['status'] == 'FAIL':
-                        ssd_result['status'] = 'FAIL'
-                    
-                    if test_result['warnings']:
-                        ssd_result['warnings'].extend(test_result['warnings'])
-                        ssd_result['warning_count'] += len(test_result['warnings'])
-        
-        temp_file = os.path.join(ssd_dir, f'{test_time}-{ssd_sn}-temperature.txt')
-        
-        if os.path.exists(temp_file):
-            temp_analysis = self._analyze_temperature_data(temp_file)
+                if test_result['status'] == 'FAIL':
+                    ssd_result['status'] = 'FAIL'
+                
+                if test_result['warnings']:
+                    ssd_result['warnings'].extend(test_result['warnings'])
+                    ssd_result['warning_count'] += len(test_result['warnings'])
+        
+        temp_analysis = None
+        if temp_file:
+            try:
+                temp_analysis = self._analyze_temperature_data(temp_file)
+            except FileNotFoundError:
+                pass
+        
+        if temp_analysis is not None:
             ssd_result['temperature_analysis'] = temp_analysis
             
             if temp_analysis['max_temp'] > self.max_temperature:
@@ -121,12 +205,10 @@ class TestResultAnalyzer:
         lines = section.strip().split('\n')
         
         for line in lines:
-            if line.startswith('错误类型:'):
-                error_info['type'] = line.split(':', 1)[1].strip()
-            elif line.startswith('错误信息:'):
-                error_info['message'] = line.split(':', 1)[1].strip()
-            elif line.startswith('错误时间:'):
-                error_info['timestamp'] = line.split(':', 1)[1].strip()
+            label, sep, value = line.partition(':')
+            key = _ERROR_LABELS.get(label) if sep else None
+            if key:
+                error_info[key] = value.strip()
         
         if 'type' in error_info and 'message' in error_info:
             return error_info
@@ -149,21 +231,27 @@ class TestResultAnalyzer:
             'warnings': []
         }
         
-        with open(filepath, 'r', encoding='utf-8') as f:
+        with open(filepath, 'rb') as f:
             content = f.read()
         
-        if '退出状态: 0' not in content:
+        if _EXIT_OK not in content:
             test_result['status'] = 'FAIL'
         
-        if 'error' in content.lower() or 'fail' in content.lower():
+        seen = set()
+        for match in _MARKER_RE.finditer(content):
+            seen.add(match.lastgroup)
+            if 'fail' in seen and 'verify' in seen:
+                break
+        
+        if 'error' in seen or 'fail' in seen:
             test_result['warnings'].append('测试输出中包含错误或失败信息')
         
-        if 'verify' in content.lower() and 'fail' in content.lower():
+        if 'verify' in seen and 'fail' in seen:
             test_result['status'] = 'FAIL'
             test_result['warnings'].append('数据校验失败')
         
         if test_item == 'PCT':
-            pct_analysis = self._analyze_pct_result(content)
+            pct_analysis = self._analyze_pct_result(content.decode('utf-8'))
             test_result.update(pct_analysis)
         
         return test_result
@@ -171,61 +259,56 @@ class TestResultAnalyzer:
     def _analyze_pct_result(self, content: str) -> Dict:
         result = {}
         
-        cycle_match = re.search(r'第(\d+)轮', content)
-        if cycle_match:
-            result['cycle'] = int(cycle_match.group(1))
-        
-        io_match = re.search(r'IOPS\s*:\s*([\d.]+[kK]?)', content)
-        if io_match:
-            result['iops'] = io_match.group(1)
-        
-        bw_match = re.search(r'bw\s*[:=]\s*([\d.]+[KMGT]?B/s)', content, re.IGNORECASE)
-        if bw_match:
-            result['bandwidth'] = bw_match.group(1)
-        
-        lat_match = re.search(r'lat\s*\([^)]+\)\s*[:=]\s*([\d.]+[mu]s)', content, re.IGNORECASE)
-        if lat_match:
-            result['latency'] = lat_match.group(1)
+        for match in _PCT_RE.finditer(content):
+            field = match.lastgroup
+            if field in result:
+                continue
+            
+            value = match.group(field)
+            result[field] = int(value) if field == 'cycle' else value
+            
+            if len(result) == len(_PCT_FIELDS):
+                break
         
         return result
 
     def _analyze_temperature_data(self, filepath: str) -> Dict:
-        temp_analysis = {
-            'temperatures': [],
-            'max_temp': -999,
-            'min_temp': 999,
-            'avg_temp': 0,
-            'max_temp_time': '',
-            'min_temp_time': ''
-        }
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        for line in lines:
-            if ':' in line and '°C' in line:
-                try:
-                    temp_str = line.split('°C')[0].split(':')[-1].strip()
-                    temp = float(temp_str)
-                    timestamp = line.split(':')[0] + ':' + line.split(':')[1]
+        max_temp, min_temp = -999, 999
+        max_temp_time = min_temp_time = ''
+        sum_temp = 0.0
+        count = 0
+        
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                mapping = contextlib.nullcontext(b'')
+            
+            with mapping as data:
+                for match in _TEMP_LINE_RE.finditer(data):
+                    try:
+                        temp = float(match.group(2))
+                    except ValueError:
+                        continue
                     
-                    temp_analysis['temperatures'].append(temp)
+                    sum_temp += temp
+                    count += 1
                     
-                    if temp > temp_analysis['max_temp']:
-                        temp_analysis['max_temp'] = temp
-                        temp_analysis['max_temp_time'] = timestamp
+                    if temp > max_temp:
+                        max_temp = temp
+                        max_temp_time = (match.group(1) or b'').decode('utf-8', 'replace')
                     
-                    if temp < temp_analysis['min_temp']:
-                        temp_analysis['min_temp'] = temp
-                        temp_analysis['min_temp_time'] = timestamp
-                
-                except (ValueError, IndexError):
-                    continue
-        
-        if temp_analysis['temperatures']:
-            temp_analysis['avg_temp'] = sum(temp_analysis['temperatures']) / len(temp_analysis['temperatures'])
-        
-        return temp_analysis
+                    if temp < min_temp:
+                        min_temp = temp
+                        min_temp_time = (match.group(1) or b'').decode('utf-8', 'replace')
+        
+        return {
+            'max_temp': max_temp,
+            'min_temp': min_temp,
+            'avg_temp': sum_temp / count if count else 0,
+            'max_temp_time': max_temp_time,
+            'min_temp_time': min_temp_time
+        }
 
     def check_ssd_disconnection(self, ssd_info_initial: Dict, ssd_info_current: Dict) -> List[Dict]:
         errors = []
@@ -270,41 +353,47 @@ class TestResultAnalyzer:
         return errors
 
     def generate_summary_report(self, analysis_result: Dict) -> str:
-        summary = f'测试结果分析报告\n'
-        summary += f'='*50 + '\n'
-        summary += f'测试时间: {analysis_result["test_time"]}\n'
-        summary += f'总体状态: {analysis_result["overall_status"]}\n'
-        summary += f'错误数量: {analysis_result["error_count"]}\n'
-        summary += f'警告数量: {analysis_result["warning_count"]}\n'
-        summary += f'测试SSD数量: {len(analysis_result["ssd_results"])}\n\n'
-        
-        pass_count = sum(1 for ssd in analysis_result["ssd_results"].values() if ssd["status"] == "PASS")
-        fail_count = sum(1 for ssd in analysis_result["ssd_results"].values() if ssd["status"] == "FAIL")
-        
-        summary += f'通过SSD数量: {pass_count}\n'
-        summary += f'失败SSD数量: {fail_count}\n\n'
-        
-        summary += '详细结果:\n'
-        summary += '-'*50 + '\n'
+        parts = [
+            '测试结果分析报告\n',
+            '='*50 + '\n',
+            f'测试时间: {analysis_result["test_time"]}\n',
+            f'总体状态: {analysis_result["overall_status"]}\n',
+            f'错误数量: {analysis_result["error_count"]}\n',
+            f'警告数量: {analysis_result["warning_count"]}\n',
+            f'测试SSD数量: {len(analysis_result["ssd_results"])}\n\n'
+        ]
+        
+        pass_count = fail_count = 0
+        for ssd in analysis_result["ssd_results"].values():
+            if ssd["status"] == "PASS":
+                pass_count += 1
+            elif ssd["status"] == "FAIL":
+                fail_count += 1
+        
+        parts.append(f'通过SSD数量: {pass_count}\n')
+        parts.append(f'失败SSD数量: {fail_count}\n\n')
+        
+        parts.append('详细结果:\n')
+        parts.append('-'*50 + '\n')
         
         for ssd_sn, ssd_result in analysis_result["ssd_results"].items():
-            summary += f'\nSSD SN: {ssd_sn}\n'
-            summary += f'状态: {ssd_result["status"]}\n'
-            summary += f'错误数: {ssd_result["error_count"]}\n'
-            summary += f'警告数: {ssd_result["warning_count"]}\n'
+            parts.append(f'\nSSD SN: {ssd_sn}\n'
+                         f'状态: {ssd_result["status"]}\n'
+                         f'错误数: {ssd_result["error_count"]}\n'
+                         f'警告数: {ssd_result["warning_count"]}\n')
             
             if ssd_result["errors"]:
-                summary += '错误列表:\n'
+                parts.append('错误列表:\n')
                 for error in ssd_result["errors"]:
-                    summary += f'  - [{error["type"]}] {error["message"]}\n'
+                    parts.append(f'  - [{error["type"]}] {error["message"]}\n')
             
             if ssd_result["warnings"]:
-                summary += '警告列表:\n'
+                parts.append('警告列表:\n')
                 for warning in ssd_result["warnings"]:
-                    summary += f'  - {warning}\n'
+                    parts.append(f'  - {warning}\n')
             
             if 'temperature_analysis' in ssd_result:
                 temp = ssd_result['temperature_analysis']
-                summary += f'温度分析: 最高{temp["max_temp"]}°C, 最低{temp["min_temp"]}°C, 平均{temp["avg_temp"]:.1f}°C\n'
+                parts.append(f'温度分析: 最高{temp["max_temp"]}°C, 最低{temp["min_temp"]}°C, 平均{temp["avg_temp"]:.1f}°C\n')
         
-        return summary
+        return ''.join(parts)
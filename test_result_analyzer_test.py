@@ -0,0 +1,78 @@
+import os
+import shutil
+import tempfile
+import unittest
+from logger import TestResultLogger
+from test_result_analyzer import TestResultAnalyzer
+
+class TestTestResultAnalyzer(unittest.TestCase):
+
+    def setUp(self):
+        """设置测试环境"""
+        self.log_dir = tempfile.mkdtemp()
+        self.result_logger = TestResultLogger(self.log_dir)
+        self.analyzer = TestResultAnalyzer({'analysis': {'max_temperature': 85, 'min_temperature': -45}})
+
+    def tearDown(self):
+        """清理测试环境"""
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+
+    def _write_temperature_file(self, temperature_data):
+        self.result_logger.log_temperature_data('SN001', temperature_data, '20260211_121841')
+        return os.path.join(self.log_dir, '20260211_121841', 'SN001', '20260211_121841-SN001-temperature.txt')
+
+    def test_analyze_temperature_summary(self):
+        """测试解析 log_temperature_data 写出的温度总结文件"""
+        filepath = self._write_temperature_file([
+            '测试开始时间: 2026-02-11 12:27:08',
+            '测试结束时间: 2026-02-11 12:29:42',
+            '开始温度: 45.0°C',
+            '结束温度: 92.0°C',
+            '温度变化: +47.0°C'
+        ])
+
+        result = self.analyzer._analyze_temperature_data(filepath)
+
+        self.assertEqual(result['max_temp'], 92.0)
+        self.assertEqual(result['min_temp'], 45.0)
+        self.assertAlmostEqual(result['avg_temp'], (45.0 + 92.0 + 47.0) / 3)
+        self.assertEqual(result['max_temp_time'], '')
+        self.assertEqual(result['min_temp_time'], '')
+
+    def test_analyze_temperature_with_timestamp(self):
+        """测试带时间戳的温度记录"""
+        filepath = self._write_temperature_file([
+            '2026-02-11 12:27:49: 48.0°C',
+            '2026-02-11 12:28:19: 52.5°C',
+            '2026-02-11 12:28:49: 50.0°C'
+        ])
+
+        result = self.analyzer._analyze_temperature_data(filepath)
+
+        self.assertEqual(result['max_temp'], 52.5)
+        self.assertEqual(result['min_temp'], 48.0)
+        self.assertEqual(result['max_temp_time'], '2026-02-11 12:28')
+        self.assertEqual(result['min_temp_time'], '2026-02-11 12:27')
+
+    def test_analyze_temperature_no_data(self):
+        """测试没有温度数据的文件"""
+        filepath = self._write_temperature_file([])
+
+        result = self.analyzer._analyze_temperature_data(filepath)
+
+        self.assertEqual(result['max_temp'], -999)
+        self.assertEqual(result['min_temp'], 999)
+        self.assertEqual(result['avg_temp'], 0)
+
+    def test_temperature_high_error(self):
+        """测试温度超过阈值时 SSD 结果判定为失败"""
+        self._write_temperature_file(['开始温度: 45.0°C', '结束温度: 92.0°C'])
+
+        ssd_dir = os.path.join(self.log_dir, '20260211_121841', 'SN001')
+        result = self.analyzer._analyze_ssd_results('SN001', ssd_dir, '20260211_121841')
+
+        self.assertEqual(result['status'], 'FAIL')
+        self.assertIn('TEMPERATURE_HIGH', [error['type'] for error in result['errors']])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,12 @@
 import configparser
+import functools
 from typing import List, Dict, Optional, Tuple
 from logger import ConsoleLogger
 
 
 class TestCommand:
+    __slots__ = ('command_type', 'params')
+
     def __init__(self, command_type: str, params: Dict):
         self.command_type = command_type
         self.params = params
@@ -12,6 +15,52 @@ class TestCommand:
         return f'TestCommand({self.command_type}, {self.params})'
 
 
+def _parse_temp(parts: List[str]) -> Optional[TestCommand]:
+    if len(parts) >= 3:
+        temperature = float(parts[1])
+        hold_time = int(parts[2])
+        return TestCommand('TEMP', {'temperature': temperature, 'hold_time': hold_time})
+    return None
+
+
+def _parse_pct(parts: List[str]) -> TestCommand:
+    if len(parts) >= 2:
+        cycles = int(parts[1])
+        return TestCommand('PCT', {'cycles': cycles})
+    return TestCommand('PCT', {'cycles': 1})
+
+
+def _parse_capacity(command_type: str, parts: List[str], min_percent: int) -> TestCommand:
+    if len(parts) >= 2:
+        capacity_percent = int(parts[1])
+        if min_percent <= capacity_percent <= 100:
+            return TestCommand(command_type, {'capacity_percent': capacity_percent})
+        raise ValueError(f'{command_type}测试容量百分比必须在{min_percent}-100之间')
+    return TestCommand(command_type, {'capacity_percent': 100})
+
+
+def _cached_config(getter):
+    @functools.wraps(getter)
+    def wrapper(self):
+        value = self._config_cache.get(getter.__name__)
+        if value is None:
+            value = getter(self)
+            self._config_cache[getter.__name__] = value
+        if isinstance(value, list):
+            return [dict(item) for item in value]
+        return dict(value)
+    return wrapper
+
+
+_LINE_HANDLERS = {
+    'TEMP': _parse_temp,
+    'PCT': _parse_pct,
+    'BIT': lambda parts: _parse_capacity('BIT', parts, 1),
+    'CTTW': lambda parts: _parse_capacity('CTTW', parts, 0),
+    'CTTR': lambda parts: _parse_capacity('CTTR', parts, 0),
+}
+
+
 class TestScriptParser:
     def __init__(self, logger: Optional[ConsoleLogger] = None):
         self.logger = logger
@@ -56,54 +105,11 @@ class TestScriptParser:
             return None
         
         command_type = parts[0].upper()
-        
-        if command_type == 'TEMP':
-            if len(parts) >= 3:
-                temperature = float(parts[1])
-                hold_time = int(parts[2])
-                return TestCommand('TEMP', {'temperature': temperature, 'hold_time': hold_time})
-        
-        elif command_type == 'PCT':
-            if len(parts) >= 2:
-                cycles = int(parts[1])
-                return TestCommand('PCT', {'cycles': cycles})
-            else:
-                return TestCommand('PCT', {'cycles': 1})
-        
-        elif command_type == 'BIT':
-            if len(parts) >= 2:
-                capacity_percent = int(parts[1])
-                if 1 <= capacity_percent <= 100:
-                    return TestCommand('BIT', {'capacity_percent': capacity_percent})
-                else:
-                    raise ValueError('BIT测试容量百分比必须在1-100之间')
-            else:
-                return TestCommand('BIT', {'capacity_percent': 100})
-        
-        elif command_type == 'CTTW':
-            if len(parts) >= 2:
-                capacity_percent = int(parts[1])
-                if 0 <= capacity_percent <= 100:
-                    return TestCommand('CTTW', {'capacity_percent': capacity_percent})
-                else:
-                    raise ValueError('CTTW测试容量百分比必须在0-100之间')
-            else:
-                return TestCommand('CTTW', {'capacity_percent': 100})
-        
-        elif command_type == 'CTTR':
-            if len(parts) >= 2:
-                capacity_percent = int(parts[1])
-                if 0 <= capacity_percent <= 100:
-                    return TestCommand('CTTR', {'capacity_percent': capacity_percent})
-                else:
-                    raise ValueError('CTTR测试容量百分比必须在0-100之间')
-            else:
-                return TestCommand('CTTR', {'capacity_percent': 100})
-        
-        else:
+        handler = _LINE_HANDLERS.get(command_type)
+        if handler is None:
             raise ValueError(f'未知命令类型: {command_type}')
         
-        return None
+        return handler(parts)
 
     def get_commands(self) -> List[TestCommand]:
         return self.commands
@@ -156,12 +162,20 @@ class TestConfigParser:
         self.config_path = config_path
         self.logger = logger
         self.config = None
+        self._config_cache = {}
         self._load_config()
 
     def _load_config(self):
+        self._config_cache = {}
         self.config = configparser.ConfigParser()
         try:
-            self.config.read(self.config_path, encoding='utf-8')
+            try:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    self.config.read_string(f.read(), source=self.config_path)
+            except FileNotFoundError:
+                pass
+            if self.config.has_section('test_hosts'):
+                self.get_test_hosts_config()
             if self.logger:
                 self.logger.info(f'配置文件加载成功: {self.config_path}')
         except Exception as e:
@@ -169,6 +183,7 @@ class TestConfigParser:
                 self.logger.error(f'配置文件加载失败: {e}')
             raise
 
+    @_cached_config
     def get_serial_config(self) -> Dict:
         return {
             'port': self.config.get('serial', 'port', fallback='COM1'),
@@ -179,6 +194,7 @@ class TestConfigParser:
             'timeout': self.config.getint('serial', 'timeout', fallback=2)
         }
 
+    @_cached_config
     def get_chamber_config(self) -> Dict:
         return {
             'command_set': self.config.getint('chamber', 'command_set', fallback=1),
@@ -186,6 +202,7 @@ class TestConfigParser:
             'wait_time_after_stop': self.config.getint('chamber', 'wait_time_after_stop', fallback=60)
         }
 
+    @_cached_config
     def get_test_hosts_config(self) -> List[Dict]:
         hosts = []
         test_hosts_section = self.config['test_hosts']
@@ -206,6 +223,7 @@ class TestConfigParser:
         
         return hosts
 
+    @_cached_config
     def get_ssh_config(self) -> Dict:
         return {
             'username': self.config.get('ssh', 'username', fallback='root'),
@@ -215,6 +233,7 @@ class TestConfigParser:
             'command_timeout': self.config.getint('ssh', 'command_timeout', fallback=300)
         }
 
+    @_cached_config
     def get_pct_config(self) -> Dict:
         return {
             'wait_time_after_wol': self.config.getint('pct', 'wait_time_after_wol', fallback=40),
@@ -222,21 +241,25 @@ class TestConfigParser:
             'fio_size': self.config.get('pct', 'fio_size', fallback='1G')
         }
 
+    @_cached_config
     def get_bit_config(self) -> Dict:
         return {
             'temperature_check_interval': self.config.getint('bit', 'temperature_check_interval', fallback=30)
         }
 
+    @_cached_config
     def get_cttw_config(self) -> Dict:
         return {
             'temperature_check_interval': self.config.getint('cttw', 'temperature_check_interval', fallback=30)
         }
 
+    @_cached_config
     def get_cttr_config(self) -> Dict:
         return {
             'temperature_check_interval': self.config.getint('cttr', 'temperature_check_interval', fallback=30)
         }
 
+    @_cached_config
     def get_logging_config(self) -> Dict:
         return {
             'console_log_dir': self.config.get('logging', 'console_log_dir', fallback='./console_log'),
@@ -245,6 +268,7 @@ class TestConfigParser:
             'log_backup_count': self.config.getint('logging', 'log_backup_count', fallback=5)
         }
 
+    @_cached_config
     def get_analysis_config(self) -> Dict:
         return {
             'max_temperature': self.config.getint('analysis', 'max_temperature', fallback=85),
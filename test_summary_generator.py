@@ -1,20 +1,80 @@
 import os
+import re
+import sys
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+# 配置文件中的 key = value 行（忽略以 # 开头的注释行）
+_CONFIG_LINE_RE = re.compile(r'^\s*([^#\s=][^=\n]*)=(.*)$', re.MULTILINE)
+
+
+def _to_bool(value: str) -> bool:
+    return value.lower() == 'true'
+
+
+# 支持从文件加载的配置项及其类型转换
+_CONFIG_CONVERTERS = {
+    'enable_summary': _to_bool,
+    'include_timestamp': _to_bool,
+    'include_duration': _to_bool,
+    'include_temperature': _to_bool,
+    'include_test_type': _to_bool,
+    'include_ssd_info': _to_bool,
+    'validate_fast_fail': _to_bool,
+    'min_summary_length': int,
+    'max_summary_length': int,
+    'time_format': str,
+    'temperature_unit': str
+}
+
+# fast_mode 下 str.format 占位符到 % 格式的对应关系
+_PERCENT_FIELDS = {
+    '{test_type}': '%(test_type)s',
+    '{end_time}': '%(end_time)s',
+    '{duration:.2f}': '%(duration).2f',
+    '{temperature}': '%(temperature)s',
+    '{unit}': '%(unit)s',
+    '{ssd_sn}': '%(ssd_sn)s'
+}
+_FORMAT_FIELD_RE = re.compile('|'.join(re.escape(field) for field in _PERCENT_FIELDS))
+
+
+def _to_percent_template(format_template: str) -> Optional[str]:
+    """把 str.format 模板转换为等价的 % 格式模板
+    
+    Args:
+        format_template: str.format 风格的模板
+        
+    Returns:
+        转换后的模板；含有无法转换的占位符时返回 None
+    """
+    percent_template = _FORMAT_FIELD_RE.sub(
+        lambda match: _PERCENT_FIELDS[match.group()],
+        format_template.replace('%', '%%')
+    )
+    if '{' in percent_template or '}' in percent_template:
+        return None
+    return percent_template
 
 
 class TestSummaryGenerator:
     """测试总结生成器
     
     用于生成标准化的测试总结，支持不同测试类型，提供配置选项和验证机制。
+    
+    生成总结的开销几乎全部在字符串格式化上，numba 之类的 JIT 对此没有帮助
+    （编译时间反而得不偿失），优化应放在模板预拼接、缓存和 join 上。
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, fast_mode: bool = False):
         """初始化测试总结生成器
         
         Args:
             config: 配置字典，可覆盖默认配置
+            fast_mode: 是否把预拼接的模板转换为 % 格式，减少 str.format 的字段解析开销
         """
+        self.fast_mode = fast_mode
+        
         # 默认配置
         self.default_config = {
             'enable_summary': True,
@@ -28,6 +88,7 @@ class TestSummaryGenerator:
             'temperature_unit': 'C',
             'min_summary_length': 100,
             'max_summary_length': 1000,
+            'validate_fast_fail': False,
             'summary_template': {
                 'header': '============================================================\n',
                 'footer': '============================================================\n',
@@ -44,13 +105,84 @@ class TestSummaryGenerator:
         self.config = self.default_config.copy()
         if config:
             self.config.update(config)
-            # 处理嵌套配置
+            # 处理嵌套配置：在默认模板的基础上合并，update 已经用用户的（可能不完整的）模板替换了默认模板
             if 'summary_template' in config:
-                self.config['summary_template'].update(config['summary_template'])
+                self.config['summary_template'] = {
+                    **self.default_config['summary_template'],
+                    **config['summary_template']
+                }
+        
+        # 已确认存在的输出目录，避免每次保存都调用 makedirs
+        self._known_dirs = set()
+        self.reconfigure()
+    
+    def reconfigure(self) -> None:
+        """根据当前配置重新构建预编译的总结模板
+        
+        各 include_* 开关在初始化后基本不变，因此把启用的模板行预先拼接成一个
+        格式字符串，生成总结时只需一次 format 调用。直接修改 self.config 后
+        需要调用本方法使其生效。
+        """
+        template = self.config['summary_template']
+        line_switches = [
+            ('include_test_type', 'test_type_line'),
+            ('include_timestamp', 'end_time_line'),
+            ('include_duration', 'duration_line'),
+            ('include_temperature', 'temperature_line'),
+            ('include_ssd_info', 'ssd_info_line')
+        ]
+        self._compiled_template = ''.join(
+            template[line_key] for switch, line_key in line_switches if self.config[switch]
+        )
+        # 自定义模板含有无法转换的占位符时仍使用 str.format
+        self._percent_template = _to_percent_template(self._compiled_template) if self.fast_mode else None
+        
+        # 缓存生成总结时用到的配置项，避免每次调用都查字典
+        self._enable_summary = self.config['enable_summary']
+        self._include_timestamp = self.config['include_timestamp']
+        self._time_format = self.config['time_format']
+        self._temperature_unit = self.config['temperature_unit']
+        self._header = template['header']
+        self._footer = template['footer']
+        self._additional_info_line = template['additional_info_line']
+        
+        # 按测试类型缓存的验证锚点（必需内容、头部、尾部）及其组合正则
+        self._validation_cache = {}
+        # 按测试类型缓存已格式化的标题行
+        self._type_line_cache = {}
+    
+    def _get_type_line(self, test_type: str) -> str:
+        """获取指定测试类型已格式化的标题行"""
+        type_line = self._type_line_cache.get(test_type)
+        if type_line is None:
+            type_line = self.config['summary_template']['test_type_line'].format(test_type=test_type)
+            self._type_line_cache[test_type] = type_line
+        return type_line
+    
+    def _get_validation_anchors(self, test_type: str) -> Tuple[Tuple[str, ...], str, str, Optional[re.Pattern]]:
+        """获取指定测试类型的验证锚点及一次扫描用的组合正则
+        
+        Args:
+            test_type: 测试类型
+            
+        Returns:
+            (必需内容元组, 头部, 尾部, 组合正则)
+        """
+        cached = self._validation_cache.get(test_type)
+        if cached is None:
+            template = self.config['summary_template']
+            required_contents = (f"{test_type}测试总结", "测试结束时间", "测试总耗时")
+            header, footer = template['header'], template['footer']
+            anchors = sorted({a for a in required_contents + (header, footer) if a}, key=len, reverse=True)
+            pattern = re.compile('|'.join(re.escape(a) for a in anchors)) if anchors else None
+            cached = (required_contents, header, footer, pattern)
+            self._validation_cache[test_type] = cached
+        return cached
     
     def generate_test_summary(self, test_type: str, ssd_sn: str, start_time: datetime, 
                            end_time: datetime, temperature: float, 
-                           additional_info: Optional[Dict[str, Any]] = None) -> str:
+                           additional_info: Optional[Dict[str, Any]] = None,
+                           validate: bool = True) -> str:
         """生成单个测试总结
         
         Args:
@@ -60,60 +192,53 @@ class TestSummaryGenerator:
             end_time: 测试结束时间
             temperature: 测试温度
             additional_info: 额外信息字典
+            validate: 是否在生成后立即验证总结
             
         Returns:
             生成的测试总结内容
         """
-        if not self.config['enable_summary']:
+        if not self._enable_summary:
             return ''
         
         # 计算测试时长
         test_duration = (end_time - start_time).total_seconds()
         
-        # 获取模板
-        template = self.config['summary_template']
-        
-        # 构建总结内容
-        summary_content = template['header']
-        
-        # 添加测试类型
-        if self.config['include_test_type']:
-            summary_content += template['test_type_line'].format(test_type=test_type)
-        
-        # 添加测试结束时间
-        if self.config['include_timestamp']:
-            formatted_end_time = end_time.strftime(self.config['time_format'])
-            summary_content += template['end_time_line'].format(end_time=formatted_end_time)
-        
-        # 添加测试总耗时
-        if self.config['include_duration']:
-            summary_content += template['duration_line'].format(duration=test_duration)
-        
-        # 添加测试温度
-        if self.config['include_temperature']:
-            unit = self.config['temperature_unit']
-            summary_content += template['temperature_line'].format(
-                temperature=temperature, 
-                unit=unit
-            )
-        
-        # 添加SSD信息
-        if self.config['include_ssd_info']:
-            summary_content += template['ssd_info_line'].format(ssd_sn=ssd_sn)
+        # 格式化测试结束时间
+        formatted_end_time = ''
+        if self._include_timestamp:
+            formatted_end_time = end_time.strftime(self._time_format)
+        
+        # 构建总结内容（启用的各行已在 reconfigure 中预先拼接）
+        fields = {
+            'test_type': test_type,
+            'end_time': formatted_end_time,
+            'duration': test_duration,
+            'temperature': temperature,
+            'unit': self._temperature_unit,
+            'ssd_sn': ssd_sn
+        }
+        if self._percent_template is not None:
+            body = self._percent_template % fields
+        else:
+            body = self._compiled_template.format_map(fields)
+        parts = [self._header, body]
         
         # 添加额外信息
         if additional_info:
-            summary_content += '\n额外信息:\n'
+            parts.append('\n额外信息:\n')
+            format_info = self._additional_info_line.format
             for key, value in additional_info.items():
-                summary_content += template['additional_info_line'].format(key=key, value=value)
+                parts.append(format_info(key=key, value=value))
         
-        summary_content += template['footer']
+        parts.append(self._footer)
+        summary_content = ''.join(parts)
         
         # 验证总结
-        validation_result = self.validate_summary(summary_content, test_type)
-        if not validation_result['valid']:
-            # 记录验证错误，但仍然返回生成的总结
-            print(f"警告: 生成的总结未通过验证: {validation_result['errors']}")
+        if validate:
+            validation_result = self.validate_summary(summary_content, test_type)
+            if not validation_result['valid']:
+                # 记录验证错误，但仍然返回生成的总结
+                print(f"警告: 生成的总结未通过验证: {validation_result['errors']}")
         
         return summary_content
     
@@ -127,21 +252,38 @@ class TestSummaryGenerator:
             生成的测试总结字典，键为测试标识符，值为总结内容
         """
         summaries = {}
+        warnings = []
         
         for summary_config in test_summaries:
-            # 生成总结
+            # 同类测试反复出现，驻留后各处按 test_type 查缓存时可直接比较对象
+            test_type = summary_config['test_type']
+            if isinstance(test_type, str):
+                test_type = sys.intern(test_type)
+            ssd_sn = summary_config['ssd_sn']
+            
+            # 生成总结（验证在下面统一进行）
             summary_content = self.generate_test_summary(
-                test_type=summary_config['test_type'],
-                ssd_sn=summary_config['ssd_sn'],
+                test_type=test_type,
+                ssd_sn=ssd_sn,
                 start_time=summary_config['start_time'],
                 end_time=summary_config['end_time'],
                 temperature=summary_config['temperature'],
-                additional_info=summary_config.get('additional_info')
+                additional_info=summary_config.get('additional_info'),
+                validate=False
             )
             
             # 生成标识符
-            identifier = f"{summary_config['test_type']}-{summary_config['ssd_sn']}"
+            identifier = '-'.join((str(test_type), str(ssd_sn)))
             summaries[identifier] = summary_content
+            
+            if summary_content:
+                validation_result = self.validate_summary(summary_content, test_type)
+                if not validation_result['valid']:
+                    warnings.append(f"{identifier}: {validation_result['errors']}")
+        
+        # 汇总输出验证警告，避免逐条打印
+        if warnings:
+            print("警告: 以下总结未通过验证:\n" + '\n'.join(warnings))
         
         return summaries
     
@@ -170,25 +312,31 @@ class TestSummaryGenerator:
             result['valid'] = False
             result['errors'].append(f"总结长度过长，当前: {length}, 最大: {self.config['max_summary_length']}")
         
-        # 验证必需内容
-        required_contents = [
-            f"{test_type}测试总结",
-            "测试结束时间",
-            "测试总耗时"
-        ]
+        # 长度不合格时总结必然无效，开启快速失败时不再扫描内容
+        if not result['valid'] and self.config['validate_fast_fail']:
+            return result
+        
+        # 一次扫描找出所有出现的锚点；未命中的再用 in 复核，避免锚点相互重叠时漏判
+        required_contents, header, footer, pattern = self._get_validation_anchors(test_type)
+        found = {''}
+        if pattern is not None:
+            found.update(match.group() for match in pattern.finditer(summary_content))
         
+        def contains(anchor: str) -> bool:
+            return anchor in found or anchor in summary_content
+        
+        # 验证必需内容
         for content in required_contents:
-            if content not in summary_content:
+            if not contains(content):
                 result['valid'] = False
                 result['errors'].append(f"缺少必需内容: {content}")
         
         # 验证格式
-        template = self.config['summary_template']
-        if template['header'] not in summary_content:
+        if not contains(header):
             result['valid'] = False
             result['errors'].append("缺少标准头部格式")
         
-        if template['footer'] not in summary_content:
+        if not contains(footer):
             result['valid'] = False
             result['errors'].append("缺少标准尾部格式")
         
@@ -217,15 +365,15 @@ class TestSummaryGenerator:
         """
         template = self.config['summary_template']
         
-        template_content = template['header']
-        template_content += template['test_type_line'].format(test_type=test_type)
-        template_content += template['end_time_line'].replace('{end_time}', '{end_time}')
-        template_content += template['duration_line'].replace('{duration:.2f}', '{duration}')
-        template_content += template['temperature_line'].replace('{temperature}', '{temperature}').replace('{unit}', self.config['temperature_unit'])
-        template_content += template['ssd_info_line'].replace('{ssd_sn}', '{ssd_sn}')
-        template_content += template['footer']
-        
-        return template_content
+        return ''.join([
+            template['header'],
+            self._get_type_line(test_type),
+            template['end_time_line'],
+            template['duration_line'].replace('{duration:.2f}', '{duration}'),
+            template['temperature_line'].replace('{unit}', self.config['temperature_unit']),
+            template['ssd_info_line'],
+            template['footer']
+        ])
     
     def save_summary_to_file(self, summary_content: str, file_path: str, append: bool = False) -> bool:
         """保存总结到文件
@@ -239,19 +387,46 @@ class TestSummaryGenerator:
             是否保存成功
         """
         try:
-            # 确保目录存在
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            
-            # 写入文件
-            mode = 'a' if append else 'w'
-            with open(file_path, mode, encoding='utf-8') as f:
+            with self.open_summary_writer(file_path, append) as f:
                 f.write(summary_content)
             
             return True
         except Exception as e:
+            # 目录可能已被删除，下次保存时重新创建
+            self._known_dirs.discard(os.path.dirname(file_path))
             print(f"保存总结到文件失败: {e}")
             return False
     
+    def open_summary_writer(self, file_path: str, append: bool = True):
+        """打开总结文件用于连续写入
+        
+        批量保存多个总结到同一文件时，可用 with 语句保持文件句柄打开，
+        避免每条总结都重新打开和关闭文件。
+        
+        Args:
+            file_path: 文件路径
+            append: 是否追加模式
+            
+        Returns:
+            已打开的文件对象
+        """
+        # 确保目录存在
+        directory = os.path.dirname(file_path)
+        if directory and directory not in self._known_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._known_dirs.add(directory)
+        
+        mode = 'a' if append else 'w'
+        try:
+            return open(file_path, mode, encoding='utf-8')
+        except FileNotFoundError:
+            if not directory:
+                raise
+            # 缓存的目录已被删除，重新创建后再打开一次
+            os.makedirs(directory, exist_ok=True)
+            self._known_dirs.add(directory)
+            return open(file_path, mode, encoding='utf-8')
+    
     def load_config_from_file(self, config_file: str) -> bool:
         """从文件加载配置
         
@@ -267,24 +442,15 @@ class TestSummaryGenerator:
             
             # 简单的配置文件解析（可根据实际格式扩展）
             with open(config_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-                        
-                        # 处理不同类型的配置
-                        if key in ['enable_summary', 'include_timestamp', 'include_duration', 
-                                 'include_temperature', 'include_test_type', 'include_ssd_info']:
-                            self.config[key] = value.lower() == 'true'
-                        elif key in ['min_summary_length', 'max_summary_length']:
-                            self.config[key] = int(value)
-                        elif key == 'time_format':
-                            self.config[key] = value
-                        elif key == 'temperature_unit':
-                            self.config[key] = value
+                text = f.read()
+            
+            for match in _CONFIG_LINE_RE.finditer(text):
+                key = match.group(1).strip()
+                converter = _CONFIG_CONVERTERS.get(key)
+                if converter:
+                    self.config[key] = converter(match.group(2).strip())
             
+            self.reconfigure()
             return True
         except Exception as e:
             print(f"加载配置文件失败: {e}")
@@ -1,3 +1,6 @@
+import os
+import shutil
+import tempfile
 import unittest
 from datetime import datetime
 from test_summary_generator import TestSummaryGenerator
@@ -72,6 +75,29 @@ class TestTestSummaryGenerator(unittest.TestCase):
         self.assertIn('BIT测试总结', summaries['BIT-1234567890'])
         self.assertIn('CTTR测试总结', summaries['CTTR-0987654321'])
     
+    def test_generate_batch_summaries_non_str_type(self):
+        """测试测试类型不是字符串时批量生成不中断"""
+        test_results = [
+            {
+                'test_type': 1,
+                'ssd_sn': '1234567890',
+                'start_time': self.start_time,
+                'end_time': self.end_time,
+                'temperature': 25.5
+            },
+            {
+                'test_type': 'BIT',
+                'ssd_sn': '0987654321',
+                'start_time': self.start_time,
+                'end_time': self.end_time,
+                'temperature': 26.0
+            }
+        ]
+        
+        summaries = self.generator.generate_batch_summaries(test_results)
+        self.assertIn('1-1234567890', summaries)
+        self.assertIn('BIT-0987654321', summaries)
+    
     def test_validate_summary(self):
         """测试验证总结功能"""
         summary = self.generator.generate_test_summary(
@@ -146,6 +172,84 @@ class TestTestSummaryGenerator(unittest.TestCase):
         
         self.assertIsInstance(summary, str)
         self.assertIn('BIT测试总结', summary)
+    
+    def test_reconfigure(self):
+        """测试修改配置后重新构建模板"""
+        self.generator.config['include_ssd_info'] = False
+        self.generator.reconfigure()
+        
+        summary = self.generator.generate_test_summary(
+            test_type='BIT',
+            ssd_sn='1234567890',
+            start_time=self.start_time,
+            end_time=self.end_time,
+            temperature=25.5
+        )
+        
+        self.assertIn('BIT测试总结', summary)
+        self.assertNotIn('SSD SN', summary)
+    
+    def test_partial_summary_template(self):
+        """测试只覆盖部分模板项时保留其余默认模板"""
+        template = {'ssd_info_line': '盘号: {ssd_sn}\n'}
+        generator = TestSummaryGenerator({'summary_template': template})
+        
+        summary = generator.generate_test_summary(
+            test_type='BIT',
+            ssd_sn='1234567890',
+            start_time=self.start_time,
+            end_time=self.end_time,
+            temperature=25.5
+        )
+        
+        self.assertIn('BIT测试总结', summary)
+        self.assertIn('盘号: 1234567890', summary)
+        self.assertEqual(template, {'ssd_info_line': '盘号: {ssd_sn}\n'})
+    
+    def test_fast_mode(self):
+        """测试fast_mode生成的总结与默认模式一致"""
+        fast_generator = TestSummaryGenerator(self.config, fast_mode=True)
+        
+        for generator in (self.generator, fast_generator):
+            generator.config['temperature_unit'] = '%C'
+            generator.reconfigure()
+        
+        summaries = [
+            generator.generate_test_summary(
+                test_type='BIT',
+                ssd_sn='1234567890',
+                start_time=self.start_time,
+                end_time=self.end_time,
+                temperature=25.5,
+                additional_info=self.additional_info
+            )
+            for generator in (self.generator, fast_generator)
+        ]
+        
+        self.assertEqual(summaries[0], summaries[1])
+        self.assertIn('25.5%C', summaries[1])
+    
+    def test_validate_fast_fail(self):
+        """测试长度不合格时快速失败"""
+        generator = TestSummaryGenerator({'validate_fast_fail': True})
+        validation_result = generator.validate_summary("这是一个无效的总结", 'BIT')
+        
+        self.assertFalse(validation_result['valid'])
+        self.assertEqual(len(validation_result['errors']), 1)
+        self.assertIn('总结长度不足', validation_result['errors'][0])
+    
+    def test_save_after_directory_removed(self):
+        """测试已缓存的目录被删除后仍能保存总结"""
+        base_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, base_dir, ignore_errors=True)
+        file_path = os.path.join(base_dir, 'summary', 'summary.txt')
+        
+        self.assertTrue(self.generator.save_summary_to_file("第一条总结\n", file_path))
+        shutil.rmtree(os.path.dirname(file_path))
+        self.assertTrue(self.generator.save_summary_to_file("第二条总结\n", file_path))
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), "第二条总结\n")
 
 if __name__ == '__main__':
     unittest.main()
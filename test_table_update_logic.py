@@ -43,8 +43,11 @@ class TestTableUpdateLogic(unittest.TestCase):
                                 def __init__(self, test_gui):
                                     self.test_gui = test_gui
                                 
-                                def get(self):
-                                    return [row.copy() for row in self.test_gui.table_data]
+                                def get(self, copy=False):
+                                    # 与PySimpleGUI一致，默认直接返回表格数据本身；调用方只在需要修改时自行复制
+                                    if copy:
+                                        return [row.copy() for row in self.test_gui.table_data]
+                                    return self.test_gui.table_data
                                 
                                 def update(self, values):
                                     self.test_gui.table_data = values
@@ -68,11 +71,8 @@ class TestTableUpdateLogic(unittest.TestCase):
         # 重写_update_table_cell方法，添加调试信息
         def debug_update_table_cell(row, col, value):
             try:
-                # 保存当前表格数据作为备份
-                backup_data = self.test_gui.window['-TEST_CONTROL_TABLE-'].get()
-                
-                # 获取当前表格数据
-                current_data = self.test_gui.window['-TEST_CONTROL_TABLE-'].get()
+                # 获取当前表格数据，同时作为回滚用的备份（下面只复制被修改的行，不会改动它）
+                backup_data = current_data = self.test_gui.window['-TEST_CONTROL_TABLE-'].get()
                 
                 # 检查索引是否有效
                 if row < 0 or row >= len(current_data):
@@ -83,8 +83,9 @@ class TestTableUpdateLogic(unittest.TestCase):
                     print(f'列索引超出范围: {col}')
                     return False
                 
-                # 修改指定单元格
-                new_data = [row.copy() for row in current_data]
+                # 修改指定单元格（只复制被修改的那一行）
+                new_data = current_data[:]
+                new_data[row] = current_data[row].copy()
                 new_data[row][col] = value
                 
                 # 更新表格
@@ -114,11 +115,8 @@ class TestTableUpdateLogic(unittest.TestCase):
         # 重写_update_table_row方法，添加调试信息
         def debug_update_table_row(row, new_row_data):
             try:
-                # 保存当前表格数据作为备份
-                backup_data = self.test_gui.window['-TEST_CONTROL_TABLE-'].get()
-                
-                # 获取当前表格数据
-                current_data = self.test_gui.window['-TEST_CONTROL_TABLE-'].get()
+                # 获取当前表格数据，同时作为回滚用的备份（下面只复制被修改的行，不会改动它）
+                backup_data = current_data = self.test_gui.window['-TEST_CONTROL_TABLE-'].get()
                 
                 # 检查行索引是否有效
                 if row < 0 or row >= len(current_data):
@@ -131,7 +129,7 @@ class TestTableUpdateLogic(unittest.TestCase):
                     return False
                 
                 # 替换指定行
-                new_data = [row.copy() for row in current_data]
+                new_data = current_data[:]
                 new_data[row] = new_row_data.copy()
                 
                 # 更新表格
@@ -161,11 +159,8 @@ class TestTableUpdateLogic(unittest.TestCase):
         # 重写_update_table_data方法，添加调试信息
         def debug_update_table_data(update_data):
             try:
-                # 保存当前表格数据作为备份
-                backup_data = self.test_gui.window['-TEST_CONTROL_TABLE-'].get()
-                
-                # 获取当前表格数据
-                current_data = self.test_gui.window['-TEST_CONTROL_TABLE-'].get()
+                # 获取当前表格数据，同时作为回滚用的备份（下面只复制被修改的行，不会改动它）
+                backup_data = current_data = self.test_gui.window['-TEST_CONTROL_TABLE-'].get()
                 
                 # 检查更新数据是否为空
                 if not update_data:
@@ -182,8 +177,9 @@ class TestTableUpdateLogic(unittest.TestCase):
                         print(f'列索引超出范围: {col}')
                         return False
                 
-                # 批量修改指定单元格
-                new_data = [row.copy() for row in current_data]
+                # 批量修改指定单元格（只复制涉及到的行）
+                rows_to_copy = {row for row, _ in update_data}
+                new_data = [row_data.copy() if i in rows_to_copy else row_data for i, row_data in enumerate(current_data)]
                 for (row, col), value in update_data.items():
                     new_data[row][col] = value
                 
@@ -1,6 +1,7 @@
 import unittest
 import sys
 import os
+import logging
 from unittest.mock import Mock, patch
 
 # 添加当前目录到路径，以便导入模块
@@ -58,10 +59,7 @@ class TestTableUpdates(unittest.TestCase):
         # 模拟_update_table_cell方法
         def mock_update_table_cell(row, col, value):
             try:
-                # 保存当前表格数据作为备份
-                backup_data = self.gui.window['-TEST_CONTROL_TABLE-'].get()
-                
-                # 获取当前表格数据
+                # 获取当前表格数据（下面只复制被修改的行，不会改动它，控件更新失败时用它回滚）
                 current_data = self.gui.window['-TEST_CONTROL_TABLE-'].get()
                 
                 # 检查索引是否有效
@@ -73,39 +71,39 @@ class TestTableUpdates(unittest.TestCase):
                     self.gui.console_logger.error(f'列索引超出范围: {col}')
                     return False
                 
-                # 修改指定单元格
-                new_data = [row.copy() for row in current_data]
+                # 修改指定单元格（只复制被修改的那一行）
+                new_data = current_data[:]
+                new_data[row] = current_data[row].copy()
                 new_data[row][col] = value
                 
                 # 更新表格
-                self.gui.window['-TEST_CONTROL_TABLE-'].update(values=new_data)
-                self.gui.window.refresh()
+                try:
+                    self.gui.window['-TEST_CONTROL_TABLE-'].update(values=new_data)
+                    self.gui.window.refresh()
+                except Exception:
+                    # 控件更新失败时回滚到原始数据
+                    self.gui.window['-TEST_CONTROL_TABLE-'].update(values=current_data)
+                    self.gui.window.refresh()
+                    self.gui.console_logger.info('表格数据已回滚到原始状态')
+                    raise
                 
-                # 比较更新前后的数据
-                diff = self.gui._compare_table_data(current_data, new_data)
-                if diff:
-                    self.gui.console_logger.info(f'表格单元格更新成功: 行={row}, 列={col}, 新值={value}')
-                    self.gui.console_logger.debug(f'更新差异: {diff}')
+                # 比较更新前后的数据（差异只用于日志输出，日志级别不输出时跳过）
+                if self.gui.console_logger.isEnabledFor(logging.INFO):
+                    diff = self.gui._compare_table_data(current_data, new_data)
+                    if diff:
+                        self.gui.console_logger.info(f'表格单元格更新成功: 行={row}, 列={col}, 新值={value}')
+                        self.gui.console_logger.debug(f'更新差异: {diff}')
                 
                 return True
                 
             except Exception as e:
-                # 发生异常时回滚到备份状态
-                if 'backup_data' in locals():
-                    self.gui.window['-TEST_CONTROL_TABLE-'].update(values=backup_data)
-                    self.gui.window.refresh()
-                    self.gui.console_logger.info('表格数据已回滚到原始状态')
-                
                 self.gui.console_logger.error(f'更新表格单元格失败: {e}')
                 return False
         
         # 模拟_update_table_row方法
         def mock_update_table_row(row, new_row_data):
             try:
-                # 保存当前表格数据作为备份
-                backup_data = self.gui.window['-TEST_CONTROL_TABLE-'].get()
-                
-                # 获取当前表格数据
+                # 获取当前表格数据（下面只复制被修改的行，不会改动它，控件更新失败时用它回滚）
                 current_data = self.gui.window['-TEST_CONTROL_TABLE-'].get()
                 
                 # 检查行索引是否有效
@@ -119,38 +117,37 @@ class TestTableUpdates(unittest.TestCase):
                     return False
                 
                 # 替换指定行
-                new_data = [row.copy() for row in current_data]
+                new_data = current_data[:]
                 new_data[row] = new_row_data.copy()
                 
                 # 更新表格
-                self.gui.window['-TEST_CONTROL_TABLE-'].update(values=new_data)
-                self.gui.window.refresh()
+                try:
+                    self.gui.window['-TEST_CONTROL_TABLE-'].update(values=new_data)
+                    self.gui.window.refresh()
+                except Exception:
+                    # 控件更新失败时回滚到原始数据
+                    self.gui.window['-TEST_CONTROL_TABLE-'].update(values=current_data)
+                    self.gui.window.refresh()
+                    self.gui.console_logger.info('表格数据已回滚到原始状态')
+                    raise
                 
-                # 比较更新前后的数据
-                diff = self.gui._compare_table_data(current_data, new_data)
-                if diff:
-                    self.gui.console_logger.info(f'表格行更新成功: 行={row}')
-                    self.gui.console_logger.debug(f'更新差异: {diff}')
+                # 比较更新前后的数据（差异只用于日志输出，日志级别不输出时跳过）
+                if self.gui.console_logger.isEnabledFor(logging.INFO):
+                    diff = self.gui._compare_table_data(current_data, new_data)
+                    if diff:
+                        self.gui.console_logger.info(f'表格行更新成功: 行={row}')
+                        self.gui.console_logger.debug(f'更新差异: {diff}')
                 
                 return True
                 
             except Exception as e:
-                # 发生异常时回滚到备份状态
-                if 'backup_data' in locals():
-                    self.gui.window['-TEST_CONTROL_TABLE-'].update(values=backup_data)
-                    self.gui.window.refresh()
-                    self.gui.console_logger.info('表格数据已回滚到原始状态')
-                
                 self.gui.console_logger.error(f'更新表格行失败: {e}')
                 return False
         
         # 模拟_update_table_data方法
         def mock_update_table_data(update_data):
             try:
-                # 保存当前表格数据作为备份
-                backup_data = self.gui.window['-TEST_CONTROL_TABLE-'].get()
-                
-                # 获取当前表格数据
+                # 获取当前表格数据（下面只复制被修改的行，不会改动它，控件更新失败时用它回滚）
                 current_data = self.gui.window['-TEST_CONTROL_TABLE-'].get()
                 
                 # 检查更新数据是否为空
@@ -158,40 +155,49 @@ class TestTableUpdates(unittest.TestCase):
                     self.gui.console_logger.warning('更新数据为空')
                     return True
                 
-                # 检查所有索引是否有效
+                # 检查索引并按行分组待修改的单元格（索引无效时原数据不受影响）
+                row_count = len(current_data)
+                cells_by_row = {}
                 for (row, col), value in update_data.items():
-                    if row < 0 or row >= len(current_data):
+                    if not 0 <= row < row_count:
                         self.gui.console_logger.error(f'行索引超出范围: {row}')
                         return False
                     
-                    if col < 0 or col >= len(current_data[0]):
+                    if not 0 <= col < len(current_data[row]):
                         self.gui.console_logger.error(f'列索引超出范围: {col}')
                         return False
+                    
+                    cells_by_row.setdefault(row, []).append((col, value))
                 
-                # 批量修改指定单元格
-                new_data = [row.copy() for row in current_data]
-                for (row, col), value in update_data.items():
-                    new_data[row][col] = value
+                # 按行写入，每个涉及到的行只复制一次
+                new_data = current_data[:]
+                for row, cells in cells_by_row.items():
+                    row_data = current_data[row].copy()
+                    for col, value in cells:
+                        row_data[col] = value
+                    new_data[row] = row_data
                 
                 # 更新表格
-                self.gui.window['-TEST_CONTROL_TABLE-'].update(values=new_data)
-                self.gui.window.refresh()
+                try:
+                    self.gui.window['-TEST_CONTROL_TABLE-'].update(values=new_data)
+                    self.gui.window.refresh()
+                except Exception:
+                    # 控件更新失败时回滚到原始数据
+                    self.gui.window['-TEST_CONTROL_TABLE-'].update(values=current_data)
+                    self.gui.window.refresh()
+                    self.gui.console_logger.info('表格数据已回滚到原始状态')
+                    raise
                 
-                # 比较更新前后的数据
-                diff = self.gui._compare_table_data(current_data, new_data)
-                if diff:
-                    self.gui.console_logger.info(f'表格数据批量更新成功，共更新 {len(update_data)} 个单元格')
-                    self.gui.console_logger.debug(f'更新差异: {diff}')
+                # 比较更新前后的数据（差异只用于日志输出，日志级别不输出时跳过）
+                if self.gui.console_logger.isEnabledFor(logging.INFO):
+                    diff = self.gui._compare_table_data(current_data, new_data)
+                    if diff:
+                        self.gui.console_logger.info(f'表格数据批量更新成功，共更新 {len(update_data)} 个单元格')
+                        self.gui.console_logger.debug(f'更新差异: {diff}')
                 
                 return True
                 
             except Exception as e:
-                # 发生异常时回滚到备份状态
-                if 'backup_data' in locals():
-                    self.gui.window['-TEST_CONTROL_TABLE-'].update(values=backup_data)
-                    self.gui.window.refresh()
-                    self.gui.console_logger.info('表格数据已回滚到原始状态')
-                
                 self.gui.console_logger.error(f'批量更新表格数据失败: {e}')
                 return False
         
@@ -337,6 +343,20 @@ class TestTableUpdates(unittest.TestCase):
         result = self.gui._update_table_cell(0, -1, 'SN: 202505202T9001\n状态: [已连接]')
         self.assertFalse(result)
     
+    def test_update_table_data_invalid_index(self):
+        """测试空表格和行长度不一致时的批量更新"""
+        # 测试行长度不一致时按所在行的长度检查列索引
+        self.gui.initial_data[1] = self.gui.initial_data[1][:3]
+        self.assertFalse(self.gui._update_table_data({(1, 4): 'SN: 202505202T9002'}))
+        self.assertTrue(self.gui._update_table_data({(0, 4): 'SN: 202505202T9001'}))
+        self.assertEqual(len(self.gui.initial_data[1]), 3)
+        
+        # 测试空表格
+        self.gui.initial_data = []
+        self.assertFalse(self.gui._update_table_data({(0, 0): 'test_host_1'}))
+        self.gui.console_logger.error.assert_called_with('行索引超出范围: 0')
+        self.assertEqual(self.gui.initial_data, [])
+    
     def test_compare_table_data(self):
         """测试数据对比功能"""
         # 准备旧数据和新数据
@@ -1,12 +1,22 @@
+import gc
+import logging
 import threading
 import queue
-import time
 from typing import Dict, List, Optional, Callable
 from datetime import datetime
 import weakref
+from collections import deque
+from itertools import islice
 
 from logger import ConsoleLogger
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+_BYTES_PER_MB = 1024 * 1024
+
 
 class ThreadPoolManager:
     def __init__(self, max_workers: int = 10, logger: Optional[ConsoleLogger] = None):
@@ -28,6 +38,7 @@ class ThreadPoolManager:
         thread = threading.Thread(target=target, args=args, kwargs=kwargs, daemon=daemon)
         
         with self.lock:
+            self.threads = [t for t in self.threads if t.is_alive()]
             self.threads.append(thread)
         
         thread.start()
@@ -62,80 +73,95 @@ class ThreadPoolManager:
 
     def get_active_count(self) -> int:
         with self.lock:
-            return sum(1 for t in self.threads if t.is_alive())
+            self.threads = [t for t in self.threads if t.is_alive()]
+            return len(self.threads)
 
 
 class ThreadSafeDict:
     def __init__(self, max_size: int = 1000, logger: Optional[ConsoleLogger] = None):
+        # 写时复制：写操作在锁内生成新字典后整体替换 self.data，读操作直接读取当前字典，无需加锁
+        # 超出 max_size 时淘汰最久未写入的键（读取不更新顺序，不是 LRU），每次写入复制整个字典，代价为 O(N)
         self.data = {}
-        self.lock = threading.RLock()
+        self.lock = threading.Lock()
         self.max_size = max_size
         self.logger = logger
 
     def set(self, key: str, value):
         with self.lock:
-            self.data[key] = value
+            data = dict(self.data)
+            data.pop(key, None)
+            data[key] = value
             
-            if len(self.data) > self.max_size:
-                oldest_key = next(iter(self.data))
-                del self.data[oldest_key]
+            if len(data) > self.max_size:
+                oldest_key = next(iter(data))
+                del data[oldest_key]
                 if self.logger:
-                    self.logger.debug(f'数据字典超出最大大小，删除最旧数据: {oldest_key}')
+                    self.logger.debug(f'数据字典超出最大大小，删除最久未写入数据: {oldest_key}')
+            
+            self.data = data
 
     def get(self, key: str, default=None):
-        with self.lock:
-            return self.data.get(key, default)
+        return self.data.get(key, default)
 
     def pop(self, key: str, default=None):
         with self.lock:
-            return self.data.pop(key, default)
+            if key not in self.data:
+                return default
+            data = dict(self.data)
+            value = data.pop(key)
+            self.data = data
+            return value
 
     def clear(self):
         with self.lock:
-            self.data.clear()
+            self.data = {}
 
     def items(self):
-        with self.lock:
-            return self.data.items()
+        return self.data.items()
 
     def __len__(self):
-        with self.lock:
-            return len(self.data)
+        return len(self.data)
 
 
 class ThreadSafeList:
     def __init__(self, max_size: int = 1000, logger: Optional[ConsoleLogger] = None):
-        self.data = []
-        self.lock = threading.RLock()
+        self.data = deque(maxlen=max_size)
+        self._snapshot = None
+        self.lock = threading.Lock()
         self.max_size = max_size
         self.logger = logger
 
     def append(self, item):
         with self.lock:
+            is_full = len(self.data) >= self.max_size
             self.data.append(item)
+            self._snapshot = None
             
-            if len(self.data) > self.max_size:
-                removed = self.data.pop(0)
-                if self.logger:
-                    self.logger.debug(f'列表超出最大大小，删除最旧数据')
+            if is_full and self.logger:
+                self.logger.debug(f'列表超出最大大小，删除最旧数据')
 
     def extend(self, items):
         with self.lock:
+            if not isinstance(items, (list, tuple)):
+                items = list(items)
+            remove_count = len(self.data) + len(items) - self.max_size
             self.data.extend(items)
+            self._snapshot = None
             
-            if len(self.data) > self.max_size:
-                remove_count = len(self.data) - self.max_size
-                self.data = self.data[remove_count:]
-                if self.logger:
-                    self.logger.debug(f'列表超出最大大小，删除{remove_count}条最旧数据')
+            if remove_count > 0 and self.logger:
+                self.logger.debug(f'列表超出最大大小，删除{remove_count}条最旧数据')
 
     def get_all(self):
         with self.lock:
-            return self.data.copy()
+            snapshot = self._snapshot
+            if snapshot is None:
+                snapshot = self._snapshot = tuple(self.data)
+            return snapshot
 
     def clear(self):
         with self.lock:
             self.data.clear()
+            self._snapshot = None
 
     def __len__(self):
         with self.lock:
@@ -145,36 +171,45 @@ class ThreadSafeList:
 class CircularBuffer:
     def __init__(self, size: int = 100, logger: Optional[ConsoleLogger] = None):
         self.size = size
-        self.buffer = []
-        self.lock = threading.RLock()
+        self.buffer = deque(maxlen=size)
+        self._snapshot = None
+        self.lock = threading.Lock()
         self.logger = logger
 
     def append(self, item):
         with self.lock:
             self.buffer.append(item)
-            
-            if len(self.buffer) > self.size:
-                self.buffer.pop(0)
+            self._snapshot = None
 
     def get_all(self):
         with self.lock:
-            return self.buffer.copy()
+            snapshot = self._snapshot
+            if snapshot is None:
+                snapshot = self._snapshot = tuple(self.buffer)
+            return snapshot
 
     def get_latest(self, count: int = 1):
         with self.lock:
-            if count >= len(self.buffer):
-                return self.buffer.copy()
-            return self.buffer[-count:]
+            length = len(self.buffer)
+            if count >= length:
+                return list(self.buffer)
+            if count <= 0:
+                return list(self.buffer)[-count:]
+            return list(islice(self.buffer, length - count, length))
 
     def clear(self):
         with self.lock:
             self.buffer.clear()
+            self._snapshot = None
 
     def __len__(self):
         with self.lock:
             return len(self.buffer)
 
 
+_CLEANUP_METHODS = ('close', 'cleanup', 'stop', 'shutdown')
+
+
 class ResourceCleaner:
     _instance = None
     _lock = threading.Lock()
@@ -187,16 +222,17 @@ class ResourceCleaner:
         return cls._instance
 
     def __init__(self):
-        self.resources = weakref.WeakSet()
+        # 资源 -> 清理方法名；只保存方法名，保存绑定方法会强引用资源导致其无法被回收
+        self.resources = weakref.WeakKeyDictionary()
         self.logger = None
 
     def register(self, resource: object):
-        self.resources.add(resource)
+        self.resources[resource] = next((name for name in _CLEANUP_METHODS if hasattr(resource, name)), None)
         if self.logger:
             self.logger.debug(f'注册资源: {type(resource).__name__}')
 
     def unregister(self, resource: object):
-        self.resources.discard(resource)
+        self.resources.pop(resource, None)
         if self.logger:
             self.logger.debug(f'注销资源: {type(resource).__name__}')
 
@@ -204,16 +240,10 @@ class ResourceCleaner:
         if self.logger:
             self.logger.info(f'开始清理所有资源，共{len(self.resources)}个')
         
-        for resource in list(self.resources):
+        for resource, method_name in list(self.resources.items()):
             try:
-                if hasattr(resource, 'close'):
-                    resource.close()
-                elif hasattr(resource, 'cleanup'):
-                    resource.cleanup()
-                elif hasattr(resource, 'stop'):
-                    resource.stop()
-                elif hasattr(resource, 'shutdown'):
-                    resource.shutdown()
+                if method_name:
+                    getattr(resource, method_name)()
                 
                 if self.logger:
                     self.logger.debug(f'清理资源: {type(resource).__name__}')
@@ -231,16 +261,24 @@ class MemoryMonitor:
         self.check_interval = 60
         self.monitor_thread = None
         self.is_running = False
-        self.callbacks = []
+        self._stop_event = threading.Event()
+        self.callbacks = ()
+        self._process = psutil.Process() if psutil else None
 
     def add_callback(self, callback: Callable[[float, float], None]):
-        self.callbacks.append(callback)
+        self.callbacks = self.callbacks + (callback,)
 
     def start(self):
         if self.is_running:
             return
         
+        if self._process is None:
+            if self.logger:
+                self.logger.warning('未安装psutil，内存监控不可用')
+            return
+        
         self.is_running = True
+        self._stop_event.clear()
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
         
@@ -249,6 +287,7 @@ class MemoryMonitor:
 
     def stop(self):
         self.is_running = False
+        self._stop_event.set()
         
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
@@ -257,35 +296,36 @@ class MemoryMonitor:
             self.logger.info('内存监控已停止')
 
     def _monitor_loop(self):
-        import psutil
-        import gc
+        process = self._process
+        logger = self.logger
+        stop_event = self._stop_event
         
-        while self.is_running:
+        while not stop_event.is_set():
             try:
-                process = psutil.Process()
                 memory_info = process.memory_info()
                 
-                rss = memory_info.rss / 1024 / 1024
-                vms = memory_info.vms / 1024 / 1024
+                rss = memory_info.rss / _BYTES_PER_MB
+                vms = memory_info.vms / _BYTES_PER_MB
                 
-                if self.logger:
-                    self.logger.debug(f'内存使用: RSS={rss:.2f}MB, VMS={vms:.2f}MB')
+                if logger and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f'内存使用: RSS={rss:.2f}MB, VMS={vms:.2f}MB')
                 
-                for callback in self.callbacks:
+                callbacks = self.callbacks
+                for callback in callbacks:
                     try:
                         callback(rss, vms)
                     except Exception as e:
-                        if self.logger:
-                            self.logger.error(f'内存监控回调失败: {e}')
+                        if logger:
+                            logger.error(f'内存监控回调失败: {e}')
                 
                 if rss > 500:
                     gc.collect()
-                    if self.logger:
-                        self.logger.warning(f'内存使用过高({rss:.2f}MB)，执行垃圾回收')
+                    if logger:
+                        logger.warning(f'内存使用过高({rss:.2f}MB)，执行垃圾回收')
                 
-                time.sleep(self.check_interval)
+                stop_event.wait(self.check_interval)
             
             except Exception as e:
-                if self.logger:
-                    self.logger.error(f'内存监控异常: {e}')
-                time.sleep(self.check_interval)
+                if logger:
+                    logger.error(f'内存监控异常: {e}')
+                stop_event.wait(self.check_interval)
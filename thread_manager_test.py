@@ -0,0 +1,78 @@
+import threading
+import unittest
+from thread_manager import ThreadSafeDict
+
+class TestThreadSafeDict(unittest.TestCase):
+
+    def test_set_get(self):
+        """测试基本的读写"""
+        data = ThreadSafeDict(max_size=10)
+        data.set('a', 1)
+        data.set('b', 2)
+
+        self.assertEqual(data.get('a'), 1)
+        self.assertEqual(data.get('c', 'default'), 'default')
+        self.assertEqual(data.pop('a'), 1)
+        self.assertIsNone(data.pop('a'))
+        self.assertEqual(len(data), 1)
+
+    def test_evict_oldest(self):
+        """测试超出最大大小时删除最久未写入的数据"""
+        data = ThreadSafeDict(max_size=2)
+        data.set('a', 1)
+        data.set('b', 2)
+        data.set('a', 3)
+        data.get('b')
+        data.set('c', 4)
+
+        self.assertEqual(dict(data.items()), {'a': 3, 'c': 4})
+
+    def test_iterate_items_while_reading(self):
+        """测试遍历 items() 时读取不会影响遍历"""
+        data = ThreadSafeDict(max_size=10)
+        for i in range(5):
+            data.set(str(i), i)
+
+        for key, value in data.items():
+            self.assertEqual(data.get(key), value)
+            data.set('new', value)
+
+    def test_concurrent_get_set(self):
+        """测试多线程并发读写"""
+        data = ThreadSafeDict(max_size=50)
+        errors = []
+
+        def writer(offset):
+            try:
+                for i in range(5000):
+                    key = str((i + offset) % 80)
+                    data.set(key, int(key))
+                    if i % 7 == 0:
+                        data.pop(key)
+            except Exception as e:
+                errors.append(e)
+
+        def reader():
+            try:
+                for i in range(5000):
+                    key = str(i % 80)
+                    value = data.get(key)
+                    if value is not None and value != int(key):
+                        errors.append(AssertionError(f'{key} -> {value}'))
+                    for _ in data.items():
+                        pass
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(offset,)) for offset in (0, 13)]
+        threads += [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(data), 50)
+
+if __name__ == '__main__':
+    unittest.main()